@@ -3,7 +3,8 @@ import json
 import argparse
 import gspread
 from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
+from google.auth.transport.requests import AuthorizedSession
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -14,6 +15,24 @@ SCOPES = [
     "https://www.googleapis.com/auth/drive"
 ]
 
+DRIVE_FILES_URL = "https://www.googleapis.com/drive/v3/files"
+
+# Per-type cell converters; None becomes an empty cell instead of "None"
+_CELL_CONVERTERS = {
+    str: lambda v: v,
+    int: str,
+    float: repr,
+    bool: lambda v: "TRUE" if v else "FALSE",
+    type(None): lambda v: "",
+}
+
+def _cell(value):
+    """
+    Converts a single value to its sheet cell string.
+    """
+    convert = _CELL_CONVERTERS.get(type(value))
+    return convert(value) if convert else str(value)
+
 def get_credentials():
     """
     Tries to load credentials from credentials.json.
@@ -27,7 +46,17 @@ def get_credentials():
             "Please place your 'credentials.json' file in the project root."
         )
 
-def get_or_create_folder(drive_service, folder_name, folder_id=None):
+def get_drive_session(creds):
+    """
+    Returns an authorized requests session for Drive REST calls.
+    Keeps connections to googleapis.com alive across calls.
+    """
+    session = AuthorizedSession(creds)
+    adapter = HTTPAdapter(pool_maxsize=20)
+    session.mount("https://", adapter)
+    return session
+
+def get_or_create_folder(drive_session, folder_name, folder_id=None):
     """
     Checks if a folder exists, creates it if not.
     If folder_id is provided, uses it directly.
@@ -38,8 +67,12 @@ def get_or_create_folder(drive_service, folder_name, folder_id=None):
         return folder_id
     
     query = f"mimeType='application/vnd.google-apps.folder' and name='{folder_name}' and trashed=false"
-    results = drive_service.files().list(q=query, fields="nextPageToken, files(id, name)").execute()
-    items = results.get("files", [])
+    response = drive_session.get(
+        DRIVE_FILES_URL,
+        params={"q": query, "fields": "nextPageToken, files(id, name)"}
+    )
+    response.raise_for_status()
+    items = response.json().get("files", [])
 
     if not items:
         print(f"Folder '{folder_name}' not found. Creating...")
@@ -47,8 +80,9 @@ def get_or_create_folder(drive_service, folder_name, folder_id=None):
             "name": folder_name,
             "mimeType": "application/vnd.google-apps.folder"
         }
-        folder = drive_service.files().create(body=file_metadata, fields="id").execute()
-        return folder.get("id")
+        response = drive_session.post(DRIVE_FILES_URL, params={"fields": "id"}, json=file_metadata)
+        response.raise_for_status()
+        return response.json().get("id")
     else:
         folder_id = items[0]["id"]
         print(f"Found folder '{folder_name}' (ID: {folder_id})")
@@ -66,14 +100,14 @@ def export_data_to_sheets(data, sheet_name, folder_id=None, target_spreadsheet_i
 
     creds = get_credentials()
     gc = gspread.authorize(creds)
-    drive_service = build("drive", "v3", credentials=creds)
+    drive_session = get_drive_session(creds)
 
     # 1. Get or Create "Lead Gen" folder (only if creating new sheet)
     if not target_spreadsheet_id:
         # Use provided folder_id or default to "Lead Gen" folder
         if not folder_id:
             folder_id = os.getenv("LEAD_GEN_FOLDER_ID", "0ADWgx-M8Z5r-Uk9PVA")
-        folder_id = get_or_create_folder(drive_service, "Lead Gen", folder_id=folder_id)
+        folder_id = get_or_create_folder(drive_session, "Lead Gen", folder_id=folder_id)
 
     # 2. Prepare Data
     # Flatten data if necessary (simple flattening for now)
@@ -101,7 +135,7 @@ def export_data_to_sheets(data, sheet_name, folder_id=None, target_spreadsheet_i
 
     rows = [headers]
     for item in data:
-        row = [str(item.get(k, "")) for k in headers]
+        row = [_cell(item.get(k)) for k in headers]
         rows.append(row)
 
     # 3. Create or Open Sheet
@@ -117,13 +151,17 @@ def export_data_to_sheets(data, sheet_name, folder_id=None, target_spreadsheet_i
     else:
         # Check if sheet exists in the folder
         query = f"mimeType='application/vnd.google-apps.spreadsheet' and name='{sheet_name}' and '{folder_id}' in parents and trashed=false"
-        results = drive_service.files().list(
-            q=query, 
-            fields="files(id, name)",
-            supportsAllDrives=True,
-            includeItemsFromAllDrives=True
-        ).execute()
-        items = results.get("files", [])
+        response = drive_session.get(
+            DRIVE_FILES_URL,
+            params={
+                "q": query,
+                "fields": "files(id, name)",
+                "supportsAllDrives": "true",
+                "includeItemsFromAllDrives": "true"
+            }
+        )
+        response.raise_for_status()
+        items = response.json().get("files", [])
 
         if items:
             spreadsheet_id = items[0]["id"]
@@ -136,12 +174,13 @@ def export_data_to_sheets(data, sheet_name, folder_id=None, target_spreadsheet_i
                 'mimeType': 'application/vnd.google-apps.spreadsheet',
                 'parents': [folder_id]
             }
-            file = drive_service.files().create(
-                body=file_metadata, 
-                fields='id',
-                supportsAllDrives=True
-            ).execute()
-            spreadsheet_id = file.get('id')
+            response = drive_session.post(
+                DRIVE_FILES_URL,
+                params={'fields': 'id', 'supportsAllDrives': 'true'},
+                json=file_metadata
+            )
+            response.raise_for_status()
+            spreadsheet_id = response.json().get('id')
             sh = gc.open_by_key(spreadsheet_id)
             print(f"Created new sheet '{sheet_name}' in folder")
 
@@ -43,6 +43,15 @@ SCOPES = [
     'https://www.googleapis.com/auth/drive'
 ]
 
+# Per-type cell converters; None becomes an empty cell instead of "None"
+_CELL_CONVERTERS = {
+    str: lambda v: v,
+    int: str,
+    float: repr,
+    bool: lambda v: 'TRUE' if v else 'FALSE',
+    type(None): lambda v: '',
+}
+
 
 def authenticate_google():
     """Authenticate with Google Sheets API using credentials.json (Service Account)"""
@@ -140,6 +149,12 @@ def extract_domain(url: str) -> str:
     return url
 
 
+def _cell(value: Any) -> str:
+    """Convert a single value to its sheet cell string"""
+    convert = _CELL_CONVERTERS.get(type(value))
+    return convert(value) if convert else str(value)
+
+
 def get_field_value(lead: Dict[str, Any], *possible_keys: str) -> str:
     """Get value from lead using multiple possible key names"""
     for key in possible_keys:
@@ -148,12 +163,15 @@ def get_field_value(lead: Dict[str, Any], *possible_keys: str) -> str:
     return ""
 
 
-def find_email_anymailfinder(first_name: str, last_name: str, domain: str, api_key: str, verbose: bool = False) -> Tuple[Optional[str], Optional[int], Optional[bool]]:
+def request_email_anymailfinder(first_name: str, last_name: str, domain: str, api_key: str, verbose: bool = False) -> Tuple[Optional[str], Optional[int], Optional[bool]]:
     """
     Call AnyMailFinder API to find email address.
 
     Returns:
         (email, confidence, verified) or (None, None, None) if not found
+
+    Raises:
+        requests.exceptions.RequestException on network or API errors
     """
     url = "https://api.anymailfinder.com/v5.1/find-email/person"
 
@@ -168,24 +186,33 @@ def find_email_anymailfinder(first_name: str, last_name: str, domain: str, api_k
         'domain': domain
     }
     
-    try:
-        response = requests.post(url, headers=headers, json=payload, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        if verbose:
-            print(f"  API Response: {json.dumps(data, indent=2)}")
-        
-        # Check if email was found
-        if data.get('success') and data.get('email'):
-            email = data.get('email')
-            confidence = data.get('confidence', 0)
-            verified = data.get('verified', False)
-            return email, confidence, verified
-        else:
-            return None, None, None
+    response = requests.post(url, headers=headers, json=payload, timeout=30)
+    response.raise_for_status()
+    
+    data = response.json()
     
+    if verbose:
+        print(f"  API Response: {json.dumps(data, indent=2)}")
+    
+    # Check if email was found
+    if data.get('success') and data.get('email'):
+        email = data.get('email')
+        confidence = data.get('confidence', 0)
+        verified = data.get('verified', False)
+        return email, confidence, verified
+    else:
+        return None, None, None
+
+
+def find_email_anymailfinder(first_name: str, last_name: str, domain: str, api_key: str, verbose: bool = False) -> Tuple[Optional[str], Optional[int], Optional[bool]]:
+    """
+    Call AnyMailFinder API to find email address, treating API errors as not found.
+
+    Returns:
+        (email, confidence, verified) or (None, None, None) if not found
+    """
+    try:
+        return request_email_anymailfinder(first_name, last_name, domain, api_key, verbose)
     except requests.exceptions.RequestException as e:
         print(f"  ⚠️  API Error: {e}")
         return None, None, None
@@ -209,15 +236,22 @@ def enrich_leads(leads: List[Dict[str, Any]], max_leads: int, skip_existing: boo
         'skipped_existing': 0,
         'skipped_missing_fields': 0,
         'emails_found': 0,
-        'emails_not_found': 0
+        'emails_not_found': 0,
+        'duplicates_reused': 0
     }
     
     enriched_leads = []
     leads_to_process = leads[:max_leads]
     
+    # Results per (first, last, domain) so duplicate people only cost one API call
+    results_by_key: Dict[Tuple[str, str, str], Tuple[Optional[str], Optional[int], Optional[bool]]] = {}
+    
     print(f"\n📧 Processing {len(leads_to_process)} leads...")
     print("━" * 50)
     
+    # Progress bar is redrawn at most ~10 times per second
+    last_progress_time = 0.0
+    
     for i, lead in enumerate(leads_to_process, 1):
         # Get required fields
         first_name = get_field_value(lead, 'firstName', 'first_name', 'personFirstName')
@@ -249,12 +283,30 @@ def enrich_leads(leads: List[Dict[str, Any]], max_leads: int, skip_existing: boo
         if verbose:
             print(f"[{i}/{len(leads_to_process)}] 🔍 Searching: {first_name} {last_name} @ {domain}")
         else:
-            # Show progress
-            progress = int((i / len(leads_to_process)) * 40)
-            bar = "━" * progress + "░" * (40 - progress)
-            print(f"\r{bar} {i}/{len(leads_to_process)} ({int(i/len(leads_to_process)*100)}%)", end='', flush=True)
+            # Show progress (throttled so we don't write + flush on every lead)
+            now = time.monotonic()
+            if now - last_progress_time >= 0.1 or i == len(leads_to_process):
+                progress = int((i / len(leads_to_process)) * 40)
+                bar = "━" * progress + "░" * (40 - progress)
+                sys.stdout.write(f"\r{bar} {i}/{len(leads_to_process)} ({int(i/len(leads_to_process)*100)}%)")
+                sys.stdout.flush()
+                last_progress_time = now
         
-        email, confidence, verified = find_email_anymailfinder(first_name, last_name, domain, api_key, verbose)
+        key = (first_name.lower(), last_name.lower(), domain)
+        is_duplicate = key in results_by_key
+        if is_duplicate:
+            email, confidence, verified = results_by_key[key]
+            stats['duplicates_reused'] += 1
+            if verbose:
+                print("  ♻️  Reusing result from earlier lead with same name and domain")
+        else:
+            try:
+                email, confidence, verified = request_email_anymailfinder(first_name, last_name, domain, api_key, verbose)
+                # Only real answers are reused; a failed call is retried for the next duplicate
+                results_by_key[key] = (email, confidence, verified)
+            except requests.exceptions.RequestException as e:
+                print(f"  ⚠️  API Error: {e}")
+                email, confidence, verified = None, None, None
         
         # Update lead
         if email:
@@ -273,7 +325,8 @@ def enrich_leads(leads: List[Dict[str, Any]], max_leads: int, skip_existing: boo
         enriched_leads.append(lead)
         
         # Rate limiting - small delay to avoid overwhelming API
-        time.sleep(0.5)
+        if not is_duplicate:
+            time.sleep(0.5)
     
     if not verbose:
         print()  # New line after progress bar
@@ -329,7 +382,7 @@ def save_to_google_sheets(leads: List[Dict[str, Any]], sheet_name: str):
         rows = [headers]
         
         for lead in leads:
-            row = [str(lead.get(h, '')) for h in headers]
+            row = [_cell(lead.get(h)) for h in headers]
             rows.append(row)
         
         # Write data
@@ -353,8 +406,8 @@ def save_to_google_sheets(leads: List[Dict[str, Any]], sheet_name: str):
         sys.exit(1)
 
 
-def ask_permission(leads: List[Dict[str, Any]], max_leads: int, skip_existing: bool = True):
-    """Ask user for permission before making API calls"""
+def ask_permission(leads: List[Dict[str, Any]], max_leads: int, skip_existing: bool = True, auto_confirm: bool = False):
+    """Ask user for permission before making API calls (skipped when auto_confirm is set)"""
     
     # Count leads that will actually be processed
     leads_without_email = 0
@@ -380,11 +433,14 @@ def ask_permission(leads: List[Dict[str, Any]], max_leads: int, skip_existing: b
     print(f"\n⚠️  WARNING: This will consume API credits!")
     print("=" * 50)
     
-    response = input("\nContinue? (yes/no): ").strip().lower()
-    
-    if response not in ['yes', 'y']:
-        print("\n❌ Cancelled by user")
-        sys.exit(0)
+    if not auto_confirm:
+        response = input("\nContinue? (yes/no): ").strip().lower()
+        
+        if response not in ['yes', 'y']:
+            print("\n❌ Cancelled by user")
+            sys.exit(0)
+    else:
+        print("\nAuto-confirmed (--yes flag)")
     
     print("\n✅ Starting enrichment...")
 
@@ -409,6 +465,9 @@ def print_stats(stats: Dict[str, int]):
     if stats['skipped_missing_fields'] > 0:
         print(f"  Skipped (missing fields): {stats['skipped_missing_fields']}")
     
+    if stats.get('duplicates_reused', 0) > 0:
+        print(f"  Duplicates reused (no API call): {stats['duplicates_reused']}")
+    
     print(f"  Total processed: {stats['processed']}")
     print("=" * 50)
 
@@ -431,6 +490,7 @@ def main():
     parser.add_argument('--sheet-name', help='Sheet name to read from (for Google Sheets source)')
     parser.add_argument('--include-existing', action='store_true', help='Process ALL leads including those that already have emails (by default, only empty emails are enriched)')
     parser.add_argument('--verbose', '-v', action='store_true', help='Show detailed progress')
+    parser.add_argument('--yes', '-y', action='store_true', help='Auto-confirm API credit usage (skip prompt, for automated runs)')
     
     args = parser.parse_args()
     
@@ -452,7 +512,7 @@ def main():
     skip_existing = not args.include_existing
     
     # Ask for permission
-    ask_permission(leads, args.max_leads, skip_existing)
+    ask_permission(leads, args.max_leads, skip_existing, auto_confirm=args.yes)
     
     # Enrich leads
     enriched_leads, stats = enrich_leads(leads, args.max_leads, skip_existing, args.verbose)
@@ -16,10 +16,22 @@ Usage:
 """
 
 import argparse
+import functools
+import itertools
 import json
+import logging
+import logging.handlers
+import mmap
 import os
+import random
+import re
+import sqlite3
 import sys
+import threading
 import time
+from collections import ChainMap, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 from dotenv import load_dotenv
@@ -27,6 +39,9 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+# Per-lead details go through logging; --verbose switches the level to DEBUG
+logger = logging.getLogger(__name__)
+
 # Try to import Outscraper
 try:
     from outscraper import ApiClient
@@ -35,8 +50,31 @@ except ImportError:
     OUTSCRAPER_AVAILABLE = False
     print("⚠️  Warning: Outscraper library not installed. Install with: pip install outscraper")
 
+# Try to import ijson for streaming large JSON inputs
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Try to import orjson for fast JSON serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Try to import pandas for vectorized sheet row construction
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
 # Try to import Google Sheets libraries
 try:
+    import httplib2
+    from google_auth_httplib2 import AuthorizedHttp
     from googleapiclient.discovery import build
     from googleapiclient.errors import HttpError
     GOOGLE_AVAILABLE = True
@@ -50,7 +88,144 @@ SCOPES = [
     'https://www.googleapis.com/auth/drive'
 ]
 
+# Lead fields checked (in priority order) for the company domain and existing email
+DOMAIN_KEYS = ('companyWebsite', 'company_website', 'website', 'companyDomain', 'company_domain', 'domain')
+EMAIL_KEYS = ('email', 'personEmail', 'person_email')
+
+# Number of Outscraper requests in flight at once
+DEFAULT_CONCURRENCY = 10
+
+# Number of domains sent in a single Outscraper request
+DEFAULT_BATCH_SIZE = 25
+
+# Persistent domain -> contacts cache (emails change slowly, so entries live for weeks)
+DEFAULT_CACHE_PATH = '.tmp/cache/outscraper_contacts.sqlite'
+DEFAULT_CACHE_TTL_DAYS = 30
+CACHE_KEY_VERSION = 'v1'
+
+# Client-side rate limiting and retry policy for Outscraper requests
+DEFAULT_REQUESTS_PER_SECOND = 2.0
+MAX_RETRIES = 4
+BACKOFF_BASE_SECONDS = 0.5
+MAX_BACKOFF_SECONDS = 30.0
+RETRYABLE_STATUS_RE = re.compile(r'\b(429|5\d\d)\b')
+
+# Timeout for the shared Google API HTTP connection pool
+GOOGLE_HTTP_TIMEOUT = 30
+
+# JSON inputs larger than this are streamed (when ijson is installed) instead of parsed whole
+STREAM_THRESHOLD_BYTES = 10 * 1024 * 1024
+
+# Rows per value range when writing a sheet
+SHEET_WRITE_CHUNK_ROWS = 5000
 
+# Log records buffered in memory before being written out
+LOG_BUFFER_CAPACITY = 1000
+
+# Distinct website strings whose extracted domain is memoized (leads from one company repeat the same URL)
+DOMAIN_CACHE_SIZE = 4096
+
+# Host part of a URL or bare domain, without scheme, leading www., or path
+DOMAIN_RE = re.compile(r'^(?:https?://)?(?:www\.)?([^/?#\s]+)', re.IGNORECASE)
+
+
+def configure_logging(verbose: bool = False):
+    """
+    Send log output to stdout through an in-memory buffer.
+    Records are written in chunks (or immediately for errors) instead of one syscall per line.
+    """
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter('%(message)s'))
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=LOG_BUFFER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=stream_handler
+    )
+    logger.addHandler(buffered_handler)
+    logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+    logger.propagate = False
+
+
+def flush_logs():
+    """Write out any buffered log records (call before printing to stdout directly)"""
+    for handler in logger.handlers:
+        handler.flush()
+
+
+class ContactCache:
+    """Persistent domain -> contact info cache backed by SQLite (safe to share across threads)"""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl_days: float = DEFAULT_CACHE_TTL_DAYS):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.ttl_seconds = ttl_days * 86400
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS contacts (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)'
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _key(domain: str) -> str:
+        return f"{CACHE_KEY_VERSION}:{domain}"
+
+    def get(self, domain: str) -> Optional[Dict[str, Any]]:
+        """Return cached contact info for a domain, or None on a miss/expired entry"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT value FROM contacts WHERE key = ? AND expires_at > ?',
+                (self._key(domain), time.time())
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, domain: str, contact_info: Dict[str, Any]):
+        """Store contact info for a domain (an empty dict records "nothing found")"""
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO contacts (key, value, expires_at) VALUES (?, ?, ?)',
+                (self._key(domain), json.dumps(contact_info), time.time() + self.ttl_seconds)
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class RateLimiter:
+    """Thread-safe token bucket allowing `rate` calls per second with bursts up to `capacity`"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a call is allowed"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Stop handing out calls for `seconds` (e.g. after a 429)"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+@functools.lru_cache(maxsize=1)
 def authenticate_google():
     """Authenticate with Google Sheets API using credentials.json (Service Account)"""
     creds_path = 'credentials.json'
@@ -62,14 +237,36 @@ def authenticate_google():
     return creds
 
 
+@functools.lru_cache(maxsize=1)
+def get_shared_http():
+    """Single httplib2 connection pool reused by every Google API client in this run"""
+    return httplib2.Http(timeout=GOOGLE_HTTP_TIMEOUT)
+
+
+def build_google_service(name: str, version: str, creds):
+    """Build a Google API client on top of the shared keep-alive HTTP connections"""
+    return build(name, version, http=AuthorizedHttp(creds, http=get_shared_http()))
+
+
+@functools.lru_cache(maxsize=1)
+def get_sheets_service():
+    """Sheets API client, built once per run"""
+    return build_google_service('sheets', 'v4', authenticate_google())
+
+
+@functools.lru_cache(maxsize=1)
+def get_drive_service():
+    """Drive API client, built once per run"""
+    return build_google_service('drive', 'v3', authenticate_google())
+
+
 def load_from_google_sheets(spreadsheet_url: str, sheet_name: Optional[str] = None):
     """Load leads from Google Sheets"""
     if not GOOGLE_AVAILABLE:
         print("❌ Error: Google Sheets libraries not available. Install with: pip install google-api-python-client google-auth")
         sys.exit(1)
 
-    creds = authenticate_google()
-    service = build('sheets', 'v4', credentials=creds)
+    service = get_sheets_service()
 
     # Extract spreadsheet ID from URL
     if '/d/' in spreadsheet_url:
@@ -110,14 +307,42 @@ def load_from_google_sheets(spreadsheet_url: str, sheet_name: Optional[str] = No
         sys.exit(1)
 
 
-def load_from_json(file_path: str):
-    """Load leads from JSON file"""
+def load_from_json(file_path: str, max_leads: Optional[int] = None):
+    """
+    Load leads from JSON file.
+
+    Large files (over STREAM_THRESHOLD_BYTES) are parsed incrementally with ijson
+    when `max_leads` is given, stopping after `max_leads` leads. Otherwise the
+    file is memory-mapped and parsed with orjson, falling back to stdlib json.
+    """
     if not os.path.exists(file_path):
         print(f"❌ Error: File not found: {file_path}")
         sys.exit(1)
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    file_size = os.path.getsize(file_path)
+
+    if IJSON_AVAILABLE and max_leads is not None and file_size > STREAM_THRESHOLD_BYTES:
+        with open(file_path, 'rb') as f:
+            # Peek at the first character to tell a list from a {"leads": [...]} object
+            head = f.read(1024).lstrip()
+            f.seek(0)
+            if head[:1] == b'[':
+                return list(itertools.islice(ijson.items(f, 'item', use_float=True), max_leads))
+            if head[:1] == b'{':
+                leads = list(itertools.islice(ijson.items(f, 'leads.item', use_float=True), max_leads))
+                # Nothing found may mean no "leads" key; the full parse below reports that
+                if leads:
+                    return leads
+
+    if ORJSON_AVAILABLE and file_size > 0:
+        # Parse straight from the mapped file, skipping the copy into a bytes object
+        with open(file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    data = orjson.loads(view)
+    else:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
 
     # Handle both list and dict formats
     if isinstance(data, list):
@@ -129,81 +354,238 @@ def load_from_json(file_path: str):
         sys.exit(1)
 
 
+@functools.lru_cache(maxsize=DOMAIN_CACHE_SIZE)
 def extract_domain(url: str) -> str:
     """Extract clean domain from URL or domain string"""
     if not url:
         return ""
 
-    # Remove common prefixes
-    url = url.strip().lower()
-    url = url.replace('http://', '').replace('https://', '').replace('www.', '')
-
-    # Remove path and query params
-    if '/' in url:
-        url = url.split('/')[0]
-    if '?' in url:
-        url = url.split('?')[0]
-
-    return url
+    # Single pass: skip scheme and leading www., stop at path/query/fragment
+    match = DOMAIN_RE.match(url.strip())
+    return match.group(1).lower() if match else ""
 
 
-def get_field_value(lead: Dict[str, Any], *possible_keys: str) -> str:
-    """Get value from lead using multiple possible key names"""
+def get_field_value(lead: Dict[str, Any], possible_keys: Tuple[str, ...]) -> str:
+    """Get value from lead using multiple possible key names (first non-empty wins)"""
     for key in possible_keys:
-        if key in lead and lead[key]:
-            return str(lead[key]).strip()
+        value = lead.get(key)
+        if value:
+            return str(value).strip()
     return ""
 
 
-def find_contacts_outscraper(domain: str, client: ApiClient, verbose: bool = False) -> Dict[str, Any]:
+def narrow_keys(possible_keys: Tuple[str, ...], columns) -> Tuple[str, ...]:
+    """Keep only the keys that exist as columns (every sheet row shares the same headers)"""
+    return tuple(key for key in possible_keys if key in columns)
+
+
+def parse_contact_info(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract emails, phones, and social links from a single Outscraper result"""
+    if not data:
+        return {}
+
+    return {
+        'emails': data.get('emails', []) or [],
+        'phones': data.get('phones', []) or [],
+        'facebook': data.get('facebook', ''),
+        'linkedin': data.get('linkedin', ''),
+        'twitter': data.get('twitter', ''),
+        'instagram': data.get('instagram', ''),
+        'youtube': data.get('youtube', ''),
+    }
+
+
+def get_error_status(error: Exception) -> Tuple[Optional[int], Optional[float]]:
+    """Best-effort (HTTP status, Retry-After seconds) for an Outscraper client error"""
+    response = getattr(error, 'response', None)
+    status = getattr(response, 'status_code', None)
+    retry_after = None
+
+    if response is not None:
+        header = (getattr(response, 'headers', None) or {}).get('Retry-After')
+        if header:
+            try:
+                retry_after = float(header)
+            except ValueError:
+                pass
+
+    if status is None:
+        # The client raises plain exceptions that mention the status code
+        match = RETRYABLE_STATUS_RE.search(str(error))
+        if match:
+            status = int(match.group(1))
+
+    return status, retry_after
+
+
+def find_contacts_outscraper(domains: List[str], client: ApiClient, cache: Optional[ContactCache] = None, limiter: Optional[RateLimiter] = None) -> List[Dict[str, Any]]:
     """
-    Call Outscraper API to find emails, phones, and social media links.
+    Call Outscraper API once for a batch of domains to find emails, phones, and social media links.
+    Successful lookups are written to `cache` when one is given; API errors and domains
+    missing from the response are not cached.
+    Calls wait on `limiter` and are retried with exponential backoff on 429/5xx responses.
 
     Returns:
-        Dictionary with emails, phones, and social links, or empty dict if not found
+        List of contact info dicts aligned with `domains` (empty dict where nothing was found)
     """
-    try:
-        # Call the Outscraper API
-        results = client.emails_and_contacts([domain])
-
-        if verbose:
-            print(f"  API Response: {json.dumps(results, indent=2)}")
-
-        # Results is a list, get the first item
-        if results and len(results) > 0:
-            data = results[0]
-
-            # Extract contact information
-            contact_info = {
-                'emails': data.get('emails', []) or [],
-                'phones': data.get('phones', []) or [],
-                'facebook': data.get('facebook', ''),
-                'linkedin': data.get('linkedin', ''),
-                'twitter': data.get('twitter', ''),
-                'instagram': data.get('instagram', ''),
-                'youtube': data.get('youtube', ''),
-            }
-
-            return contact_info
-        else:
-            return {}
+    for attempt in range(MAX_RETRIES + 1):
+        if limiter is not None:
+            limiter.acquire()
+
+        try:
+            # Call the Outscraper API with the whole batch
+            results = client.emails_and_contacts(domains)
+            break
+
+        except Exception as e:
+            status, retry_after = get_error_status(e)
+            retryable = status == 429 or (status is not None and 500 <= status < 600)
+
+            if not retryable or attempt == MAX_RETRIES:
+                logger.debug("  ⚠️  API Error: %s", e)
+                return [{} for _ in domains]
+
+            delay = retry_after or min(MAX_BACKOFF_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt)
+            delay += random.uniform(0, delay / 2)
+            logger.debug("  ⏳ API returned %s, retrying in %.1fs (attempt %d/%d)", status, delay, attempt + 1, MAX_RETRIES)
+
+            # Rate limited: hold back every worker, not just this one
+            if status == 429 and limiter is not None:
+                limiter.pause(delay)
+            time.sleep(delay)
+
+    # Passed as an argument so the response is only stringified if debug output is on
+    logger.debug("  API Response: %s", results)
+
+    results = results or []
+
+    # Results are index-aligned with the queries; fall back to matching on
+    # the echoed query if the API dropped or reordered entries
+    if len(results) != len(domains):
+        by_query = {
+            str(r.get('query', '')).lower(): r
+            for r in results if isinstance(r, dict)
+        }
+        results = [by_query.get(domain) for domain in domains]
 
-    except Exception as e:
-        if verbose:
-            print(f"  ⚠️  API Error: {e}")
-        return {}
+    contact_infos = [parse_contact_info(data) for data in results]
+
+    if cache is not None:
+        # A domain missing from the response (None) is not a real "nothing found"; leave it uncached
+        for domain, data, contact_info in zip(domains, results, contact_infos):
+            if data is not None:
+                cache.set(domain, contact_info)
+
+    return contact_infos
+
+
+def apply_contact_info(lead: Dict[str, Any], contact_info: Dict[str, Any], full_contact_info: bool, stats: Dict[str, int]):
+    """Write found contact information onto a lead and update stats"""
+    found_something = False
+
+    if contact_info:
+        # Emails - ALWAYS add primary email
+        emails = contact_info.get('emails', [])
+        if emails:
+            lead['email'] = emails[0]  # Primary email (always added)
+            stats['emails_found'] += 1
+            found_something = True
+
+            logger.debug("  ✅ Email: %s", emails[0])
+
+            # Only add additional fields if full_contact_info flag is set
+            if full_contact_info:
+                lead['all_emails'] = emails  # All emails
+                if len(emails) > 1:
+                    logger.debug("     Additional emails: %s%s", ', '.join(emails[1:3]), '...' if len(emails) > 3 else '')
+
+        # Phones - ONLY if full_contact_info is enabled
+        if full_contact_info:
+            phones = contact_info.get('phones', [])
+            if phones:
+                lead['phone'] = phones[0]  # Primary phone
+                lead['all_phones'] = phones  # All phones
+                stats['phones_found'] += 1
+                found_something = True
+                logger.debug("  📞 Phones: %s%s", ', '.join(phones[:3]), '...' if len(phones) > 3 else '')
+
+            # Social media links - ONLY if full_contact_info is enabled
+            social_links = []
+            for platform in ['facebook', 'linkedin', 'twitter', 'instagram', 'youtube']:
+                link = contact_info.get(platform, '')
+                if link:
+                    lead[f'{platform}_url'] = link
+                    social_links.append(platform)
+                    found_something = True
+
+            if social_links:
+                stats['socials_found'] += 1
+                logger.debug("  🔗 Social: %s", ', '.join(social_links))
+
+    if not found_something:
+        stats['not_found'] += 1
+        logger.debug("  ❌ No contact info found")
 
+    stats['processed'] += 1
 
-def enrich_leads(leads: List[Dict[str, Any]], max_leads: int, skip_existing: bool = True, full_contact_info: bool = False, verbose: bool = False) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+
+def plan_enrichment(leads: List[Dict[str, Any]], max_leads: int, skip_existing: bool = True, domain_keys: Tuple[str, ...] = DOMAIN_KEYS, email_keys: Tuple[str, ...] = EMAIL_KEYS) -> Tuple[List[Tuple[int, Dict[str, Any], str]], Dict[str, int]]:
+    """
+    Single pass over the first `max_leads` leads deciding which ones need an API lookup.
+    `domain_keys`/`email_keys` can be narrowed to the columns actually present (see narrow_keys).
+
+    Returns:
+        (work_plan, skip_counts) where work_plan holds (index, lead, clean_domain) tuples
+    """
+    leads_to_process = leads[:max_leads]
+    skip_counts = {
+        'skipped_existing': 0,
+        'skipped_missing_fields': 0
+    }
+
+    work_plan = []
+    for i, lead in enumerate(leads_to_process, 1):
+        # Get domain field
+        domain = get_field_value(lead, domain_keys)
+
+        # Clean domain
+        domain = extract_domain(domain)
+
+        # Check if we should skip
+        existing_email = get_field_value(lead, email_keys)
+
+        if skip_existing and existing_email:
+            skip_counts['skipped_existing'] += 1
+            logger.debug("[%d/%d] ⏭️  Skipped (has email): %s", i, len(leads_to_process), domain)
+            continue
+
+        # Check required fields
+        if not domain:
+            skip_counts['skipped_missing_fields'] += 1
+            logger.debug("[%d/%d] ⚠️  Skipped (missing domain)", i, len(leads_to_process))
+            continue
+
+        work_plan.append((i, lead, domain))
+
+    flush_logs()
+    return work_plan, skip_counts
+
+
+def enrich_leads(leads: List[Dict[str, Any]], work_plan: List[Tuple[int, Dict[str, Any], str]], skip_counts: Dict[str, int], max_leads: int, full_contact_info: bool = False, verbose: bool = False, concurrency: int = DEFAULT_CONCURRENCY, batch_size: int = DEFAULT_BATCH_SIZE, cache: Optional[ContactCache] = None, requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
     """
     Enrich leads with contact information using Outscraper API.
 
     Args:
         leads: List of lead dictionaries
+        work_plan: (index, lead, domain) tuples from plan_enrichment
+        skip_counts: Skip counters from plan_enrichment
         max_leads: Maximum number of leads to process
-        skip_existing: Skip leads that already have emails
         full_contact_info: If True, adds all emails, phones, and social media. If False, only primary email.
-        verbose: Show detailed progress
+        verbose: Show per-lead details (debug logging) instead of the progress bar
+        concurrency: Number of API requests in flight at once
+        batch_size: Number of domains sent per API request
+        cache: Optional persistent cache; hits are served without an API call
+        requests_per_second: Client-side cap on Outscraper request rate
 
     Returns:
         (enriched_leads, stats)
@@ -229,132 +611,135 @@ def enrich_leads(leads: List[Dict[str, Any]], max_leads: int, skip_existing: boo
         'emails_found': 0,
         'phones_found': 0,
         'socials_found': 0,
-        'not_found': 0
+        'not_found': 0,
+        'cache_hits': 0
     }
 
-    enriched_leads = []
     leads_to_process = leads[:max_leads]
-
-    print(f"\n📧 Processing {len(leads_to_process)} leads...")
+    stats.update(skip_counts)
+
+    # Group leads by domain so each company is looked up once and fanned out
+    domain_to_items: Dict[str, List[Tuple[int, Dict[str, Any]]]] = defaultdict(list)
+    for i, lead, domain in work_plan:
+        domain_to_items[domain].append((i, lead))
+
+    # Work plan was filtered up front; only cache lookups remain before the API
+    pending_domains = []
+    for domain, items in domain_to_items.items():
+        # Serve from the persistent cache when possible
+        if cache is not None:
+            cached = cache.get(domain)
+            if cached is not None:
+                stats['cache_hits'] += len(items)
+                for i, lead in items:
+                    logger.debug("[%d/%d] 💾 Cached: %s", i, len(leads_to_process), domain)
+                    apply_contact_info(lead, cached, full_contact_info, stats)
+                continue
+
+        pending_domains.append(domain)
+
+    print(f"\n📧 Processing {len(pending_domains)} unique domains ({batch_size} domains per request, {concurrency} concurrent requests)...")
     print("━" * 50)
 
-    for i, lead in enumerate(leads_to_process, 1):
-        # Get domain field
-        domain = get_field_value(lead, 'companyWebsite', 'company_website', 'website', 'companyDomain', 'company_domain', 'domain')
-
-        # Clean domain
-        domain = extract_domain(domain)
-
-        # Check if we should skip
-        existing_email = get_field_value(lead, 'email', 'personEmail', 'person_email')
-
-        if skip_existing and existing_email:
-            stats['skipped_existing'] += 1
-            enriched_leads.append(lead)
-            if verbose:
-                print(f"[{i}/{len(leads_to_process)}] ⏭️  Skipped (has email): {domain}")
-            continue
-
-        # Check required fields
-        if not domain:
-            stats['skipped_missing_fields'] += 1
-            enriched_leads.append(lead)
-            if verbose:
-                print(f"[{i}/{len(leads_to_process)}] ⚠️  Skipped (missing domain)")
-            continue
-
-        # Make API call
-        if verbose:
-            print(f"[{i}/{len(leads_to_process)}] 🔍 Searching: {domain}")
-        else:
-            # Show progress
-            progress = int((i / len(leads_to_process)) * 40)
-            bar = "━" * progress + "░" * (40 - progress)
-            print(f"\r{bar} {i}/{len(leads_to_process)} ({int(i/len(leads_to_process)*100)}%)", end='', flush=True)
-
-        contact_info = find_contacts_outscraper(domain, client, verbose)
-
-        # Update lead with contact information
-        found_something = False
-
-        if contact_info:
-            # Emails - ALWAYS add primary email
-            emails = contact_info.get('emails', [])
-            if emails:
-                lead['email'] = emails[0]  # Primary email (always added)
-                stats['emails_found'] += 1
-                found_something = True
-
-                if verbose:
-                    print(f"  ✅ Email: {emails[0]}")
-
-                # Only add additional fields if full_contact_info flag is set
-                if full_contact_info:
-                    lead['all_emails'] = emails  # All emails
-                    if verbose and len(emails) > 1:
-                        print(f"     Additional emails: {', '.join(emails[1:3])}{'...' if len(emails) > 3 else ''}")
-
-            # Phones - ONLY if full_contact_info is enabled
-            if full_contact_info:
-                phones = contact_info.get('phones', [])
-                if phones:
-                    lead['phone'] = phones[0]  # Primary phone
-                    lead['all_phones'] = phones  # All phones
-                    stats['phones_found'] += 1
-                    found_something = True
-                    if verbose:
-                        print(f"  📞 Phones: {', '.join(phones[:3])}{'...' if len(phones) > 3 else ''}")
-
-                # Social media links - ONLY if full_contact_info is enabled
-                social_links = []
-                for platform in ['facebook', 'linkedin', 'twitter', 'instagram', 'youtube']:
-                    link = contact_info.get(platform, '')
-                    if link:
-                        lead[f'{platform}_url'] = link
-                        social_links.append(platform)
-                        found_something = True
-
-                if social_links:
-                    stats['socials_found'] += 1
-                    if verbose:
-                        print(f"  🔗 Social: {', '.join(social_links)}")
-
-        if not found_something:
-            stats['not_found'] += 1
-            if verbose:
-                print(f"  ❌ No contact info found")
-
-        stats['processed'] += 1
-        enriched_leads.append(lead)
-
-        # Rate limiting - small delay to avoid overwhelming API
-        time.sleep(1)
+    # Split work into batches so each API call carries up to batch_size domains
+    batches = [pending_domains[k:k + batch_size] for k in range(0, len(pending_domains), batch_size)]
+
+    # Batches run in a bounded thread pool; results are applied as they complete
+    limiter = RateLimiter(requests_per_second)
+    completed_count = 0
+    last_progress_time = 0.0  # Progress bar is redrawn at most ~10 times per second
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        future_to_batch = {
+            executor.submit(find_contacts_outscraper, batch, client, cache, limiter): batch
+            for batch in batches
+        }
 
+        for future in as_completed(future_to_batch):
+            batch = future_to_batch[future]
+            contact_infos = future.result()
+            completed_count += len(batch)
+
+            if not verbose:
+                # Show progress (throttled so we don't write + flush on every batch)
+                now = time.monotonic()
+                if now - last_progress_time >= 0.1 or completed_count == len(pending_domains):
+                    progress = int((completed_count / len(pending_domains)) * 40)
+                    bar = "━" * progress + "░" * (40 - progress)
+                    sys.stdout.write(f"\r{bar} {completed_count}/{len(pending_domains)} ({int(completed_count/len(pending_domains)*100)}%)")
+                    sys.stdout.flush()
+                    last_progress_time = now
+
+            for domain, contact_info in zip(batch, contact_infos):
+                for i, lead in domain_to_items[domain]:
+                    logger.debug("[%d/%d] 🔍 %s", i, len(leads_to_process), domain)
+
+                    # Update lead with contact information
+                    apply_contact_info(lead, contact_info, full_contact_info, stats)
+
+    flush_logs()
     if not verbose:
         print()  # New line after progress bar
 
-    return enriched_leads, stats
+    # Leads are updated in place, so the processed slice keeps its original order
+    return list(leads_to_process), stats
 
 
 def save_to_json(leads: List[Dict[str, Any]], output_path: str):
-    """Save leads to JSON file"""
+    """Save leads to JSON file (one lead per line if the path ends in .jsonl)"""
     os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
-
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(leads, f, indent=2, ensure_ascii=False)
+    jsonl = output_path.endswith('.jsonl')
+
+    if ORJSON_AVAILABLE:
+        with open(output_path, 'wb') as f:
+            if jsonl:
+                for lead in leads:
+                    f.write(orjson.dumps(lead))
+                    f.write(b'\n')
+            else:
+                f.write(orjson.dumps(leads, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            if jsonl:
+                for lead in leads:
+                    f.write(json.dumps(lead, ensure_ascii=False))
+                    f.write('\n')
+            else:
+                json.dump(leads, f, indent=2, ensure_ascii=False)
 
     print(f"\n✅ Saved to: {output_path}")
 
 
+def build_sheet_rows(leads: List[Dict[str, Any]], headers: List[str]) -> List[List[str]]:
+    """Convert leads to string rows in `headers` order (missing/None values become empty cells)"""
+    if PANDAS_AVAILABLE:
+        # Column selection, defaulting, and casting happen in one vectorized pass;
+        # dtype=object keeps ints from being upcast to floats by missing values
+        df = pd.DataFrame(leads, columns=headers, dtype=object).fillna('')
+        return df.astype(str).values.tolist()
+
+    if not headers:
+        return [[] for _ in leads]
+
+    # One C-level itemgetter call per lead; ChainMap fills missing columns without copying the lead
+    getter = itemgetter(*headers)
+    defaults = dict.fromkeys(headers, '')
+    rows = []
+    for lead in leads:
+        values = getter(ChainMap(lead, defaults))
+        if len(headers) == 1:
+            values = (values,)  # itemgetter returns a bare value for a single key
+        rows.append(['' if value is None else str(value) for value in values])
+    return rows
+
+
 def save_to_google_sheets(leads: List[Dict[str, Any]], sheet_name: str):
     """Save leads to a new Google Spreadsheet"""
     if not GOOGLE_AVAILABLE:
         print("❌ Error: Google Sheets libraries not available")
         sys.exit(1)
 
-    creds = authenticate_google()
-    sheets_service = build('sheets', 'v4', credentials=creds)
-    drive_service = build('drive', 'v3', credentials=creds)
+    sheets_service = get_sheets_service()
+    drive_service = get_drive_service()
 
     # Create new spreadsheet
     spreadsheet = {
@@ -381,21 +766,21 @@ def save_to_google_sheets(leads: List[Dict[str, Any]], sheet_name: str):
             return
 
         headers = list(leads[0].keys())
-        rows = [headers]
-
-        for lead in leads:
-            row = [str(lead.get(h, '')) for h in headers]
-            rows.append(row)
+        rows = [headers] + build_sheet_rows(leads, headers)
 
-        # Write data
+        # Write data in row chunks, all sent in a single batchUpdate request
+        data = [
+            {'range': f'A{offset + 1}', 'values': rows[offset:offset + SHEET_WRITE_CHUNK_ROWS]}
+            for offset in range(0, len(rows), SHEET_WRITE_CHUNK_ROWS)
+        ]
         body = {
-            'values': rows
+            'valueInputOption': 'RAW',
+            'includeValuesInResponse': False,
+            'data': data
         }
 
-        sheets_service.spreadsheets().values().update(
+        sheets_service.spreadsheets().values().batchUpdate(
             spreadsheetId=spreadsheet_id,
-            range='A1',
-            valueInputOption='RAW',
             body=body
         ).execute()
 
@@ -408,17 +793,9 @@ def save_to_google_sheets(leads: List[Dict[str, Any]], sheet_name: str):
         sys.exit(1)
 
 
-def ask_permission(leads: List[Dict[str, Any]], max_leads: int, skip_existing: bool = True):
+def ask_permission(leads: List[Dict[str, Any]], work_plan: List[Tuple[int, Dict[str, Any], str]], skip_counts: Dict[str, int], max_leads: int, skip_existing: bool = True):
     """Ask user for permission before making API calls"""
-
-    # Count leads that will actually be processed
-    leads_without_email = 0
-    for lead in leads[:max_leads]:
-        existing_email = get_field_value(lead, 'email', 'personEmail', 'person_email')
-        if not existing_email:
-            leads_without_email += 1
-
-    will_process = leads_without_email if skip_existing else min(len(leads), max_leads)
+    will_process = len(work_plan)
 
     print("\n" + "=" * 50)
     print("📧 Email Enrichment Tool (Outscraper)")
@@ -426,7 +803,9 @@ def ask_permission(leads: List[Dict[str, Any]], max_leads: int, skip_existing: b
     print(f"\n📊 Summary:")
     print(f"  Total leads: {len(leads)}")
     if skip_existing:
-        print(f"  Leads without email: {leads_without_email}")
+        print(f"  Skipped (have email): {skip_counts['skipped_existing']}")
+    print(f"  Skipped (missing domain): {skip_counts['skipped_missing_fields']}")
+    if skip_existing:
         print(f"  Will process: {will_process} leads (only empty emails)")
     else:
         print(f"  Will process: {will_process} leads (including existing emails)")
@@ -472,6 +851,9 @@ def print_stats(stats: Dict[str, int], full_contact_info: bool = False):
     if stats['skipped_missing_fields'] > 0:
         print(f"  Skipped (missing domain): {stats['skipped_missing_fields']}")
 
+    if stats.get('cache_hits', 0) > 0:
+        print(f"  Served from cache (no API call): {stats['cache_hits']}")
+
     print(f"  Total processed: {stats['processed']}")
     print("=" * 50)
 
@@ -486,7 +868,7 @@ def main():
 
     # Output
     output_group = parser.add_mutually_exclusive_group(required=True)
-    output_group.add_argument('--output', help='Path to output JSON file')
+    output_group.add_argument('--output', help='Path to output JSON file (use a .jsonl extension for one lead per line)')
     output_group.add_argument('--output-sheet', help='Name for new Google Sheet')
 
     # Options
@@ -494,14 +876,21 @@ def main():
     parser.add_argument('--sheet-name', help='Sheet name to read from (for Google Sheets source)')
     parser.add_argument('--include-existing', action='store_true', help='Process ALL leads including those that already have emails (by default, only empty emails are enriched)')
     parser.add_argument('--full-contact-info', action='store_true', help='Include ALL contact fields (all_emails, phones, social media). By default, only primary email is added.')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, help=f'Number of concurrent API requests (default: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help=f'Number of domains per API request (default: {DEFAULT_BATCH_SIZE})')
+    parser.add_argument('--rps', type=float, default=DEFAULT_REQUESTS_PER_SECOND, help=f'Maximum Outscraper requests per second (default: {DEFAULT_REQUESTS_PER_SECOND})')
+    parser.add_argument('--no-cache', action='store_true', help='Always call the API, ignoring the local domain cache')
+    parser.add_argument('--cache-ttl-days', type=float, default=DEFAULT_CACHE_TTL_DAYS, help=f'How long cached domain lookups stay valid (default: {DEFAULT_CACHE_TTL_DAYS} days)')
     parser.add_argument('--verbose', '-v', action='store_true', help='Show detailed progress')
 
     args = parser.parse_args()
 
+    configure_logging(args.verbose)
+
     # Load leads
     if args.source_file:
         print(f"📂 Loading from: {args.source_file}")
-        leads = load_from_json(args.source_file)
+        leads = load_from_json(args.source_file, args.max_leads)
     else:
         print(f"📊 Loading from Google Sheet...")
         leads = load_from_google_sheets(args.source_url, args.sheet_name)
@@ -515,11 +904,25 @@ def main():
     # Determine skip_existing flag (True by default, unless --include-existing is set)
     skip_existing = not args.include_existing
 
+    # Sheet rows all share one header row, so resolve which lookup columns exist up front
+    domain_keys, email_keys = DOMAIN_KEYS, EMAIL_KEYS
+    if args.source_url:
+        domain_keys = narrow_keys(DOMAIN_KEYS, leads[0])
+        email_keys = narrow_keys(EMAIL_KEYS, leads[0])
+
+    # Decide once which leads need a lookup
+    work_plan, skip_counts = plan_enrichment(leads, args.max_leads, skip_existing, domain_keys, email_keys)
+
     # Ask for permission
-    ask_permission(leads, args.max_leads, skip_existing)
+    ask_permission(leads, work_plan, skip_counts, args.max_leads, skip_existing)
 
     # Enrich leads
-    enriched_leads, stats = enrich_leads(leads, args.max_leads, skip_existing, args.full_contact_info, args.verbose)
+    cache = None if args.no_cache else ContactCache(ttl_days=args.cache_ttl_days)
+    try:
+        enriched_leads, stats = enrich_leads(leads, work_plan, skip_counts, args.max_leads, args.full_contact_info, args.verbose, args.concurrency, args.batch_size, cache, args.rps)
+    finally:
+        if cache is not None:
+            cache.close()
 
     # Print stats
     print_stats(stats, args.full_contact_info)
@@ -16,12 +16,20 @@ Usage:
 """
 
 import argparse
+import itertools
 import json
 import os
+import random
+import re
+import sqlite3
+import statistics
 import sys
+import threading
 import time
+from collections import defaultdict
 from typing import Any, Dict, List, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -47,11 +55,167 @@ try:
 except ImportError:
     OUTSCRAPER_AVAILABLE = False
 
+# Try to import orjson for fast JSON serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Try to import ijson for streaming large JSON inputs
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 SCOPES = [
     'https://www.googleapis.com/auth/spreadsheets',
     'https://www.googleapis.com/auth/drive'
 ]
 
+# Domains sent per emails_and_contacts call
+BATCH_SIZE = 25
+
+# Parallel calls in flight: sized from the latency of the first WARMUP_BATCHES calls unless --workers is given
+WARMUP_BATCHES = 3
+MIN_WORKERS = 4
+MAX_WORKERS = 64
+
+# Client-side token bucket for Outscraper calls, plus retry policy for 429/5xx responses
+REQUESTS_PER_SECOND = 5.0
+BURST_CAPACITY = 10
+MAX_RETRIES = 4
+BACKOFF_BASE_SECONDS = 0.5
+MAX_BACKOFF_SECONDS = 30.0
+RETRYABLE_STATUS_RE = re.compile(r'\b(429|5\d\d)\b')
+
+# Consecutive failed calls before further calls are short-circuited, and how long to wait before probing again
+BREAKER_FAIL_MAX = 5
+BREAKER_RESET_SECONDS = 30.0
+
+# Persistent domain -> Outscraper payload cache (repeat lookups cost no credits)
+DEFAULT_CACHE_PATH = '.tmp/cache/outscraper_enrich.sqlite'
+DEFAULT_CACHE_TTL_DAYS = 30
+
+# JSON inputs larger than this are streamed (when ijson is installed) instead of parsed whole
+STREAM_THRESHOLD_BYTES = 10 * 1024 * 1024
+
+
+class EnrichmentCache:
+    """Persistent domain -> Outscraper payload cache backed by SQLite (safe to share across threads)"""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl_days: float = DEFAULT_CACHE_TTL_DAYS):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.ttl_seconds = ttl_days * 86400
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        # WAL lets readers proceed while a worker is writing
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS enrich (domain TEXT PRIMARY KEY, payload BLOB NOT NULL, ts INTEGER NOT NULL)'
+        )
+        self._conn.commit()
+
+    def get(self, domain: str) -> Optional[Dict[str, Any]]:
+        """Return the cached payload for a domain, or None on a miss/expired entry"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT payload FROM enrich WHERE domain = ? AND ts > ?',
+                (domain, int(time.time() - self.ttl_seconds))
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set_many(self, payloads: List[Tuple[str, Dict[str, Any]]]):
+        """Store (domain, payload) pairs in one transaction (an empty dict records "no data")"""
+        now = int(time.time())
+        with self._lock:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO enrich (domain, payload, ts) VALUES (?, ?, ?)',
+                [(domain, json.dumps(payload, ensure_ascii=False), now) for domain, payload in payloads]
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class RateLimiter:
+    """Thread-safe token bucket allowing `rate` calls per second with bursts up to `capacity`"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a call is allowed"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Stop handing out calls for `seconds` (e.g. after a 429)"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the API while the circuit breaker is open"""
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker: opens after `fail_max` consecutive failures, then rejects
+    calls until `reset_timeout` seconds pass, when a single trial call is let through.
+    """
+
+    def __init__(self, fail_max: int, reset_timeout: float):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a call may go out now"""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if not self._trial_in_flight and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._failures >= self.fail_max:
+                # (Re)open; a failed trial call restarts the timeout
+                self._opened_at = time.monotonic()
+
 
 def authenticate_google():
     """Authenticate with Google Sheets API using credentials.json (Service Account)"""
@@ -97,13 +261,13 @@ def load_from_google_sheets(spreadsheet_url: str, sheet_name: Optional[str] = No
             return []
 
         # Convert to list of dicts
+        # (the API omits trailing empty cells; zip stops at the headers, and the
+        # repeat('') lazily pads short rows without building a padded copy)
         headers = rows[0]
-        leads = []
-        for row in rows[1:]:
-            # Pad row to match headers length
-            row = row + [''] * (len(headers) - len(row))
-            lead = {headers[i]: row[i] for i in range(len(headers))}
-            leads.append(lead)
+        leads = [
+            dict(zip(headers, itertools.chain(row, itertools.repeat(''))))
+            for row in rows[1:]
+        ]
 
         return leads
 
@@ -113,11 +277,29 @@ def load_from_google_sheets(spreadsheet_url: str, sheet_name: Optional[str] = No
 
 
 def load_from_json(file_path: str):
-    """Load leads from JSON file"""
+    """
+    Load leads from JSON file.
+
+    Files over STREAM_THRESHOLD_BYTES are parsed incrementally with ijson (when
+    installed), so the raw text is never held in memory alongside the leads.
+    """
     if not os.path.exists(file_path):
         print(f"❌ Error: File not found: {file_path}")
         sys.exit(1)
 
+    if IJSON_AVAILABLE and os.path.getsize(file_path) > STREAM_THRESHOLD_BYTES:
+        with open(file_path, 'rb') as f:
+            # Peek at the first character to tell a list from a {"leads": [...]} object
+            head = f.read(1024).lstrip()
+            f.seek(0)
+            if head[:1] == b'[':
+                return list(ijson.items(f, 'item', use_float=True))
+            if head[:1] == b'{':
+                leads = list(ijson.items(f, 'leads.item', use_float=True))
+                # Nothing found may mean no "leads" key; the full parse below reports that
+                if leads:
+                    return leads
+
     with open(file_path, 'r', encoding='utf-8') as f:
         data = json.load(f)
 
@@ -136,17 +318,18 @@ def extract_domain(url: str) -> str:
     if not url:
         return ""
 
-    # Remove common prefixes
-    url = url.strip().lower()
-    url = url.replace('http://', '').replace('https://', '').replace('www.', '')
+    # urlsplit needs a scheme to find the host; it also drops userinfo and port
+    url = url.strip()
+    if '://' not in url:
+        url = 'http://' + url
 
-    # Remove path and query params
-    if '/' in url:
-        url = url.split('/')[0]
-    if '?' in url:
-        url = url.split('?')[0]
+    try:
+        host = urlsplit(url).hostname or ""
+    except ValueError:
+        # e.g. an unbalanced IPv6 bracket
+        return ""
 
-    return url
+    return host[4:] if host.startswith('www.') else host
 
 
 def get_field_value(lead: Dict[str, Any], *possible_keys: str) -> str:
@@ -157,32 +340,169 @@ def get_field_value(lead: Dict[str, Any], *possible_keys: str) -> str:
     return ""
 
 
-def enrich_with_outscraper(client: ApiClient, domain: str, verbose: bool = False) -> Optional[Dict[str, Any]]:
+def get_error_status(error: Exception) -> Tuple[Optional[int], Optional[float]]:
+    """Best-effort (HTTP status, Retry-After seconds) for an Outscraper client error"""
+    response = getattr(error, 'response', None)
+    status = getattr(response, 'status_code', None)
+    retry_after = None
+
+    if response is not None:
+        header = (getattr(response, 'headers', None) or {}).get('Retry-After')
+        if header:
+            try:
+                retry_after = float(header)
+            except ValueError:
+                pass
+
+    if status is None:
+        # The client raises plain exceptions that mention the status code
+        match = RETRYABLE_STATUS_RE.search(str(error))
+        if match:
+            status = int(match.group(1))
+
+    return status, retry_after
+
+
+def call_with_retries(client: ApiClient, domains: List[str], limiter: Optional[RateLimiter] = None, verbose: bool = False):
+    """
+    Call emails_and_contacts for `domains`, waiting on `limiter` before every attempt.
+    429/5xx errors are retried with exponential backoff and full jitter; anything else is raised.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        if limiter is not None:
+            limiter.acquire()
+
+        try:
+            return client.emails_and_contacts(domains, async_request=False)
+
+        except Exception as e:
+            status, retry_after = get_error_status(e)
+            retryable = status == 429 or (status is not None and 500 <= status < 600)
+            if not retryable or attempt == MAX_RETRIES:
+                raise
+
+            delay = retry_after or random.uniform(0, min(MAX_BACKOFF_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt))
+            if verbose:
+                print(f"  ⏳ API returned {status}, retrying in {delay:.1f}s (attempt {attempt + 1}/{MAX_RETRIES})")
+
+            # Rate limited: hold back every worker, not just this one
+            if status == 429 and limiter is not None:
+                limiter.pause(delay)
+            time.sleep(delay)
+
+
+def enrich_with_outscraper(client: ApiClient, domains: List[str], verbose: bool = False, limiter: Optional[RateLimiter] = None, breaker: Optional[CircuitBreaker] = None, cache: Optional[EnrichmentCache] = None) -> List[Optional[Dict[str, Any]]]:
     """
-    Call Outscraper API to find emails, phones, and contacts.
+    Call Outscraper API once for a batch of domains to find emails, phones, and contacts.
+    Calls are throttled by `limiter` and retried on 429/5xx responses.
+    Domains present in a successful response are written to `cache` when one is given;
+    API errors and domains missing from the response are not cached.
 
     Returns:
-        Enrichment data dict or None if error
+        List of enrichment data dicts aligned with `domains` (None where nothing came back or on error)
+
+    Raises:
+        CircuitOpenError: `breaker` is open, so no call was made
     """
+    if breaker is not None and not breaker.allow():
+        raise CircuitOpenError()
+
     try:
-        results = client.emails_and_contacts([domain])
+        results = call_with_retries(client, domains, limiter, verbose)
+        if breaker is not None:
+            breaker.record_success()
 
         if verbose:
             print(f"  API Response: {json.dumps(results, indent=2)}")
 
-        if results and len(results) > 0:
-            return results[0]
-        else:
-            return None
+        results = results or []
+
+        # Results are index-aligned with the queries; fall back to matching on
+        # the echoed query if the API dropped or reordered entries
+        if len(results) != len(domains):
+            by_query = {
+                str(r.get('query', '')).lower(): r
+                for r in results if isinstance(r, dict)
+            }
+            results = [by_query.get(domain) for domain in domains]
+
+        if cache is not None:
+            # Only domains the response actually covers; missing ones are retried next run
+            cache.set_many([(domain, data or {}) for domain, data in zip(domains, results) if data is not None])
+
+        return [data or None for data in results]
 
     except Exception as e:
+        if breaker is not None:
+            breaker.record_failure()
         print(f"  ⚠️  API Error: {e}")
-        return None
+        return [None] * len(domains)
+
+
+def apply_enrichment(lead: Dict[str, Any], domain: str, data: Optional[Dict[str, Any]], stats: Dict[str, int], verbose: bool = False):
+    """Write Outscraper data onto a lead and update stats"""
+    if data:
+        # Emails
+        emails = data.get('emails', [])
+        if emails:
+            # Extract email values
+            email_list = [e.get('value', '') for e in emails if e.get('value')]
+            lead['emails'] = email_list
+            lead['primary_email'] = email_list[0] if email_list else ''
+            lead['emails_raw'] = emails  # Full email objects with names/titles
+            stats['contacts_found'] += 1
+            if verbose:
+                print(f"  ✅ {domain}: Found {len(email_list)} email(s)")
+        else:
+            stats['contacts_not_found'] += 1
+            if verbose:
+                print(f"  ❌ {domain}: No contacts found")
+
+        # Phones
+        phones = data.get('phones', [])
+        if phones:
+            phone_list = [p.get('value', '') for p in phones if p.get('value')]
+            lead['phones'] = phone_list
+            lead['primary_phone'] = phone_list[0] if phone_list else ''
+
+        # Individual contacts (with names and titles)
+        contacts = data.get('contacts', [])
+        if contacts:
+            lead['contacts'] = contacts
+
+        # Social media
+        socials = data.get('socials', {})
+        if socials:
+            lead['socials'] = socials
+            # Also add individual social fields for easier access
+            for platform, url in socials.items():
+                lead[f'social_{platform}'] = url
+
+        # Company details
+        details = data.get('details', {})
+        if details:
+            lead['company_name'] = details.get('name', '')
+            lead['industry'] = details.get('industry', [])
+            lead['employees'] = details.get('employees', '')
+            lead['founded'] = details.get('founded', '')
+            lead['company_address'] = details.get('address', '')
+            lead['company_city'] = details.get('city', '')
+            lead['company_state'] = details.get('state', '')
+            lead['company_postal_code'] = details.get('postal_code', '')
+            lead['company_country'] = details.get('country', '')
+    else:
+        stats['contacts_not_found'] += 1
+        if verbose:
+            print(f"  ❌ {domain}: No data returned")
 
+    stats['processed'] += 1
 
-def enrich_leads(leads: List[Dict[str, Any]], max_leads: int, verbose: bool = False) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+
+def enrich_leads(leads: List[Dict[str, Any]], max_leads: int, verbose: bool = False, cache: Optional[EnrichmentCache] = None, workers: Optional[int] = None) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
     """
     Enrich leads with contact data using Outscraper API.
+    Domains found in `cache` are served from it without an API call.
+    `workers` fixes the thread count; by default it is derived from warmup call latency.
 
     Returns:
         (enriched_leads, stats)
@@ -200,12 +520,20 @@ def enrich_leads(leads: List[Dict[str, Any]], max_leads: int, verbose: bool = Fa
     # Initialize Outscraper client
     client = ApiClient(api_key=api_key)
 
+    # Shared by all workers so the combined call rate stays within budget
+    limiter = RateLimiter(REQUESTS_PER_SECOND, BURST_CAPACITY)
+
+    # Stops sending batches while Outscraper keeps failing instead of letting every task time out
+    breaker = CircuitBreaker(BREAKER_FAIL_MAX, BREAKER_RESET_SECONDS)
+
     stats = {
         'total': len(leads),
         'processed': 0,
         'skipped_no_domain': 0,
         'contacts_found': 0,
-        'contacts_not_found': 0
+        'contacts_not_found': 0,
+        'skipped_upstream_open': 0,
+        'cache_hits': 0
     }
 
     # Filter leads with domains
@@ -221,6 +549,25 @@ def enrich_leads(leads: List[Dict[str, Any]], max_leads: int, verbose: bool = Fa
     # Limit to max_leads
     leads_to_process = leads_with_domains[:max_leads]
 
+    # Leads from the same company share a domain: look each domain up once and fan the result out
+    domain_to_leads = defaultdict(list)
+    for lead, domain in leads_to_process:
+        domain_to_leads[domain].append(lead)
+    stats['duplicates_reused'] = len(leads_to_process) - len(domain_to_leads)
+
+    # Split off domains already in the cache; only the rest cost credits
+    cached_domains = []
+    if cache is not None:
+        uncached_domains = []
+        for domain in domain_to_leads:
+            payload = cache.get(domain)
+            if payload is None:
+                uncached_domains.append(domain)
+            else:
+                cached_domains.append((domain, payload))
+    else:
+        uncached_domains = list(domain_to_leads)
+
     # Show summary and ask for confirmation
     print("\n📧 Outscraper Email & Contact Finder")
     print("=" * 60)
@@ -228,7 +575,11 @@ def enrich_leads(leads: List[Dict[str, Any]], max_leads: int, verbose: bool = Fa
     print(f"  Total leads: {stats['total']}")
     print(f"  Leads with valid domains: {len(leads_with_domains)}")
     print(f"  Will process: {len(leads_to_process)} leads")
-    print(f"  Estimated cost: ~{len(leads_to_process)} credits")
+    if stats['duplicates_reused']:
+        print(f"  Unique domains: {len(domain_to_leads)}")
+    if cached_domains:
+        print(f"  Cached (no API call): {len(cached_domains)} domains")
+    print(f"  Estimated cost: ~{len(uncached_domains)} credits")
     print(f"\n⚠️  WARNING: This will consume API credits!")
     print("=" * 60)
 
@@ -238,102 +589,86 @@ def enrich_leads(leads: List[Dict[str, Any]], max_leads: int, verbose: bool = Fa
         sys.exit(0)
 
     enriched_leads = []
-    completed_count = 0
-
-    print(f"\n📧 Processing {len(leads_to_process)} leads in parallel...")
-    print("━" * 50)
-
-    # Helper function to process a single lead
-    def process_lead(lead_domain_tuple):
-        lead, domain = lead_domain_tuple
-        data = enrich_with_outscraper(client, domain, False)
-        return lead, domain, data
-
-    # Use ThreadPoolExecutor for parallel processing
-    max_workers = 10  # Parallel threads
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
-        future_to_lead = {
-            executor.submit(process_lead, (lead, domain)): (lead, domain)
-            for lead, domain in leads_to_process
-        }
+    last_progress_time = 0.0  # Progress bar is redrawn at most ~10 times per second
+
+    # Helper function to apply one batch's results to every lead with those domains and update the progress bar
+    def record_batch(batch, results, upstream_open):
+        nonlocal last_progress_time
+        for domain, data in zip(batch, results):
+            domain_leads = domain_to_leads[domain]
+            if upstream_open:
+                # Counted as not found below; tracked separately so the summary shows why
+                stats['skipped_upstream_open'] += len(domain_leads)
+
+            for lead in domain_leads:
+                # Update lead with enriched data
+                apply_enrichment(lead, domain, data, stats, verbose)
+                enriched_leads.append(lead)
+
+        # Show progress (throttled so we don't write + flush on every batch)
+        if not verbose:
+            completed_count = len(enriched_leads)
+            now = time.monotonic()
+            if now - last_progress_time >= 0.1 or completed_count == len(leads_to_process):
+                progress = int((completed_count / len(leads_to_process)) * 40)
+                bar = "━" * progress + "░" * (40 - progress)
+                sys.stdout.write(f"\r{bar} {completed_count}/{len(leads_to_process)} ({int(completed_count/len(leads_to_process)*100)}%)")
+                sys.stdout.flush()
+                last_progress_time = now
 
-        # Process completed tasks
-        for future in as_completed(future_to_lead):
-            lead, domain, data = future.result()
-            completed_count += 1
-
-            # Update lead with enriched data
-            if data:
-                # Emails
-                emails = data.get('emails', [])
-                if emails:
-                    # Extract email values
-                    email_list = [e.get('value', '') for e in emails if e.get('value')]
-                    lead['emails'] = email_list
-                    lead['primary_email'] = email_list[0] if email_list else ''
-                    lead['emails_raw'] = emails  # Full email objects with names/titles
-                    stats['contacts_found'] += 1
-                    if verbose:
-                        print(f"  ✅ {domain}: Found {len(email_list)} email(s)")
-                else:
-                    stats['contacts_not_found'] += 1
-                    if verbose:
-                        print(f"  ❌ {domain}: No contacts found")
-
-                # Phones
-                phones = data.get('phones', [])
-                if phones:
-                    phone_list = [p.get('value', '') for p in phones if p.get('value')]
-                    lead['phones'] = phone_list
-                    lead['primary_phone'] = phone_list[0] if phone_list else ''
-
-                # Individual contacts (with names and titles)
-                contacts = data.get('contacts', [])
-                if contacts:
-                    lead['contacts'] = contacts
-
-                # Social media
-                socials = data.get('socials', {})
-                if socials:
-                    lead['socials'] = socials
-                    # Also add individual social fields for easier access
-                    for platform, url in socials.items():
-                        lead[f'social_{platform}'] = url
-
-                # Company details
-                details = data.get('details', {})
-                if details:
-                    lead['company_name'] = details.get('name', '')
-                    lead['industry'] = details.get('industry', [])
-                    lead['employees'] = details.get('employees', '')
-                    lead['founded'] = details.get('founded', '')
-                    lead['company_address'] = details.get('address', '')
-                    lead['company_city'] = details.get('city', '')
-                    lead['company_state'] = details.get('state', '')
-                    lead['company_postal_code'] = details.get('postal_code', '')
-                    lead['company_country'] = details.get('country', '')
-            else:
-                stats['contacts_not_found'] += 1
-                if verbose:
-                    print(f"  ❌ {domain}: No data returned")
+    for domain, payload in cached_domains:
+        stats['cache_hits'] += len(domain_to_leads[domain])
+        record_batch([domain], [payload], False)
 
-            stats['processed'] += 1
-            enriched_leads.append(lead)
+    print(f"\n📧 Processing {len(leads_to_process)} leads in batches of {BATCH_SIZE}...")
+    print("━" * 50)
 
-            # Show progress
-            if not verbose:
-                progress = int((completed_count / len(leads_to_process)) * 40)
-                bar = "━" * progress + "░" * (40 - progress)
-                print(f"\r{bar} {completed_count}/{len(leads_to_process)} ({int(completed_count/len(leads_to_process)*100)}%)", end='', flush=True)
+    # Helper function to process one batch of domains with a single API call
+    def process_batch(batch):
+        try:
+            return batch, enrich_with_outscraper(client, batch, False, limiter, breaker, cache), False
+        except CircuitOpenError:
+            return batch, [None] * len(batch), True
+
+    domain_iter = iter(uncached_domains)
+    batches = list(iter(lambda: list(itertools.islice(domain_iter, BATCH_SIZE)), []))
+
+    if workers is None:
+        # Warm up with a few sequential calls and size the pool so that
+        # workers x latency covers the rate budget without oversubscribing it
+        warmup, batches = batches[:WARMUP_BATCHES], batches[WARMUP_BATCHES:]
+        latencies = []
+        for batch in warmup:
+            started = time.monotonic()
+            record_batch(*process_batch(batch))
+            latencies.append(time.monotonic() - started)
+
+        workers = MIN_WORKERS
+        if latencies:
+            median_latency = statistics.median(latencies)
+            workers = max(MIN_WORKERS, min(MAX_WORKERS, int(REQUESTS_PER_SECOND * median_latency * 1.5)))
+            if verbose and batches:
+                print(f"  ⚙️  Using {workers} workers (median latency {median_latency:.2f}s)")
+
+    if batches:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Submit all tasks
+            future_to_batch = {
+                executor.submit(process_batch, batch): batch_index
+                for batch_index, batch in enumerate(batches)
+            }
+
+            # Process completed tasks
+            for future in as_completed(future_to_batch):
+                record_batch(*future.result())
 
     if not verbose:
         print()  # New line after progress bar
 
-    # Add leads that were skipped (no domain)
-    for lead in leads:
-        if lead not in enriched_leads:
-            enriched_leads.append(lead)
+    # Add leads that were skipped (no domain or over max_leads); leads are
+    # updated in place, so identity tells processed ones apart without comparing dicts
+    processed_ids = {id(lead) for lead, _ in leads_to_process}
+    enriched_leads.extend(lead for lead in leads if id(lead) not in processed_ids)
 
     return enriched_leads, stats
 
@@ -342,8 +677,13 @@ def save_to_json(leads: List[Dict[str, Any]], output_path: str):
     """Save leads to JSON file"""
     os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(leads, f, indent=2, ensure_ascii=False)
+    if ORJSON_AVAILABLE:
+        # Serialized to UTF-8 bytes in C and written in one call
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(leads, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(leads, f, indent=2, ensure_ascii=False)
 
     print(f"\n✅ Saved to: {output_path}")
 
@@ -376,25 +716,28 @@ def save_to_google_sheets(leads: List[Dict[str, Any]], sheet_name: str):
         print("⚠️  No leads to save")
         return
 
-    # Flatten nested structures for Google Sheets
-    flattened_leads = []
-    for lead in leads:
-        flat_lead = {}
-        for key, value in lead.items():
-            if isinstance(value, (list, dict)):
-                flat_lead[key] = json.dumps(value, ensure_ascii=False)
-            else:
-                flat_lead[key] = value
-        flattened_leads.append(flat_lead)
+    # Flatten nested structures for Google Sheets; one serializer is set up for all cells
+    if ORJSON_AVAILABLE:
+        dumps = lambda value: orjson.dumps(value).decode('utf-8')
+    else:
+        dumps = json.JSONEncoder(ensure_ascii=False).encode
+
+    flattened_leads = [
+        {key: dumps(value) if isinstance(value, (list, dict)) else value for key, value in lead.items()}
+        for lead in leads
+    ]
 
-    # Get all unique headers
-    headers = list(set(k for lead in flattened_leads for k in lead.keys()))
-    headers.sort()
+    # Get all unique headers in first-seen order (input columns first, then enrichment fields)
+    headers = list(dict.fromkeys(k for lead in flattened_leads for k in lead))
 
-    # Build rows
+    # Build rows by placing each lead's own fields at their column position,
+    # rather than looking up every header in every lead
+    col_index = {h: i for i, h in enumerate(headers)}
     rows = [headers]
     for lead in flattened_leads:
-        row = [str(lead.get(h, '')) for h in headers]
+        row = [''] * len(headers)
+        for key, value in lead.items():
+            row[col_index[key]] = value if isinstance(value, str) else str(value)
         rows.append(row)
 
     # Write to sheet
@@ -429,6 +772,9 @@ def main():
     # Optional arguments
     parser.add_argument('--sheet-name', help='Sheet name (for Google Sheets source)', default=None)
     parser.add_argument('--max-leads', type=int, default=50, help='Maximum leads to process (default: 50)')
+    parser.add_argument('--workers', type=int, default=None, help=f'Parallel API calls (default: sized from measured latency, {MIN_WORKERS}-{MAX_WORKERS})')
+    parser.add_argument('--no-cache', action='store_true', help='Always call the API, ignoring the local domain cache')
+    parser.add_argument('--cache-ttl-days', type=float, default=DEFAULT_CACHE_TTL_DAYS, help=f'How long cached domain lookups stay valid (default: {DEFAULT_CACHE_TTL_DAYS} days)')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
 
     args = parser.parse_args()
@@ -447,7 +793,12 @@ def main():
         sys.exit(1)
 
     # Enrich leads
-    enriched_leads, stats = enrich_leads(leads, args.max_leads, args.verbose)
+    cache = None if args.no_cache else EnrichmentCache(ttl_days=args.cache_ttl_days)
+    try:
+        enriched_leads, stats = enrich_leads(leads, args.max_leads, args.verbose, cache, args.workers)
+    finally:
+        if cache is not None:
+            cache.close()
 
     # Print summary
     print("\n" + "=" * 60)
@@ -455,6 +806,12 @@ def main():
     print(f"   Contacts found: {stats['contacts_found']} ({int(stats['contacts_found']/stats['processed']*100) if stats['processed'] > 0 else 0}%)")
     print(f"   No contacts found: {stats['contacts_not_found']} ({int(stats['contacts_not_found']/stats['processed']*100) if stats['processed'] > 0 else 0}%)")
     print(f"   Skipped (no domain): {stats['skipped_no_domain']}")
+    if stats['skipped_upstream_open']:
+        print(f"   Skipped (Outscraper unavailable): {stats['skipped_upstream_open']}")
+    if stats['cache_hits']:
+        print(f"   Served from cache (no API call): {stats['cache_hits']}")
+    if stats['duplicates_reused']:
+        print(f"   Duplicate domains reused (no API call): {stats['duplicates_reused']}")
     print(f"   Total processed: {stats['processed']}")
     print("=" * 60)
 
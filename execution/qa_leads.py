@@ -12,13 +12,48 @@ Usage:
 
 import json
 import argparse
+import os
+import re
 import sys
-from typing import List, Dict, Tuple
+from typing import Dict, Iterable, List, Tuple
 
+# Try to import ijson for streaming large JSON inputs
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
-def analyze_leads(leads: List[Dict], target_keywords: List[str]) -> Tuple[int, List[str], List[Dict]]:
+# JSON inputs larger than this are streamed (when ijson is installed) instead of parsed whole
+STREAM_THRESHOLD_BYTES = 10 * 1024 * 1024
+
+
+def load_leads(file_path: str) -> Iterable[Dict]:
+    """
+    Load leads from a JSON array file.
+
+    Small files are parsed with json.load. Files over STREAM_THRESHOLD_BYTES are
+    returned as a lazy ijson iterator (when installed) so only one lead is in
+    memory at a time; parse errors then surface while iterating.
+    """
+    if IJSON_AVAILABLE and os.path.getsize(file_path) > STREAM_THRESHOLD_BYTES:
+        f = open(file_path, 'rb')
+        return _stream_items(f)
+
+    with open(file_path, 'r') as f:
+        return json.load(f)
+
+
+def _stream_items(f) -> Iterable[Dict]:
+    """Yield array items from an open file, closing it when exhausted."""
+    with f:
+        yield from ijson.items(f, 'item', use_float=True)
+
+
+def analyze_leads(leads: Iterable[Dict], target_keywords: List[str], verbose: bool = False) -> Tuple[int, List[str], List[Dict]]:
     """
     Analyze leads against target keywords.
+    matched_terms are only collected in verbose mode; otherwise the scan stops at the first hit.
     
     Returns:
         Tuple of (matches_count, non_matching_companies, detailed_results)
@@ -27,14 +62,31 @@ def analyze_leads(leads: List[Dict], target_keywords: List[str]) -> Tuple[int, L
     non_matches = []
     detailed_results = []
     
+    # Lowercase keywords once, keeping original case alongside for display
+    lowered_keywords = [(term, term.lower()) for term in target_keywords]
+    
+    # One alternation scanned once per lead instead of one substring scan per keyword.
+    # The lookahead reports a match at every position (so overlapping keywords are seen),
+    # and longest-first order makes each position report its longest keyword
+    lowered_terms = sorted({lowered for _, lowered in lowered_keywords if lowered}, key=len, reverse=True)
+    pattern = re.compile('(?=(' + '|'.join(map(re.escape, lowered_terms)) + '))') if lowered_terms else None
+    
     for i, lead in enumerate(leads, 1):
         company = lead.get('company_name', 'N/A')
-        keywords = (lead.get('keywords') or '').lower()
-        description = (lead.get('company_description') or '').lower()
+        # Lowercase both fields in one go (newline separator: keywords come from a
+        # comma-separated arg, so none can span both fields)
+        text = ((lead.get('keywords') or '') + '\n' + (lead.get('company_description') or '')).lower()
         
         # Check if ANY target keyword appears in keywords OR description
-        matched_terms = [term for term in target_keywords if term.lower() in keywords or term.lower() in description]
-        has_match = len(matched_terms) > 0
+        if not verbose:
+            # Pass/fail only: stop at the first hit
+            matched_terms = []
+            has_match = pattern is not None and pattern.search(text) is not None
+        else:
+            found = set(pattern.findall(text)) if pattern else set()
+            # A shorter keyword starting where a longer one matched is a substring of it
+            matched_terms = [term for term, lowered in lowered_keywords if found and any(lowered in hit for hit in found)]
+            has_match = len(matched_terms) > 0
         
         result = {
             'index': i,
@@ -158,27 +210,25 @@ Examples:
     # Parse keywords
     target_keywords = [k.strip() for k in args.keywords.split(',')]
     
-    # Load leads
+    # Load and analyze leads (large files are parsed as they are analyzed)
+    invalid_json_errors = (json.JSONDecodeError, ijson.JSONError) if IJSON_AVAILABLE else json.JSONDecodeError
     try:
-        with open(args.input_file, 'r') as f:
-            leads = json.load(f)
+        leads = load_leads(args.input_file)
+        matches, non_matches, detailed_results = analyze_leads(leads, target_keywords, args.verbose)
     except FileNotFoundError:
         print(f'Error: File not found: {args.input_file}')
         sys.exit(3)
-    except json.JSONDecodeError:
+    except invalid_json_errors:
         print(f'Error: Invalid JSON in file: {args.input_file}')
         sys.exit(3)
     
-    if not leads:
+    if not detailed_results:
         print('Error: No leads found in file')
         sys.exit(3)
     
-    # Analyze leads
-    matches, non_matches, detailed_results = analyze_leads(leads, target_keywords)
-    
     # Print results and exit with appropriate code
     exit_code = print_results(
-        len(leads), matches, non_matches, detailed_results, 
+        len(detailed_results), matches, non_matches, detailed_results, 
         target_keywords, args.threshold, args.verbose
     )
     
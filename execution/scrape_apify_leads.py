@@ -3,6 +3,8 @@ import time
 import json
 import argparse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -11,6 +13,19 @@ load_dotenv()
 APIFY_API_KEY = os.getenv("APIFY_API_KEY")
 ACTOR_ID = "code_crafter~leads-finder"
 
+# (connect, read) timeouts in seconds; a stalled socket should fail, not hang the poll loop
+REQUEST_TIMEOUT = (10, 30)
+POLL_INTERVAL_SECONDS = 5
+
+# Shared keep-alive session for every Apify call. Transient 429/5xx responses are
+# retried with backoff; POST is not retried by default, so a run is never started twice
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 502, 503, 504))
+))
+
 def scrape_leads(job_titles, contact_location, keywords, not_keywords, industries, seniority, size, fetch_count, output_file):
     if not APIFY_API_KEY:
         raise ValueError("APIFY_API_KEY not found in .env")
@@ -38,9 +53,24 @@ def scrape_leads(job_titles, contact_location, keywords, not_keywords, industrie
 
     print(f"Starting actor {ACTOR_ID} with input: {json.dumps(actor_input, indent=2)}")
 
+    # The start call, every status poll, and the dataset fetch reuse the same
+    # keep-alive connection instead of a new TLS handshake each
+    items = run_actor(_SESSION, actor_input)
+
+    # Save to file
+    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    with open(output_file, "w") as f:
+        json.dump(items, f, indent=2)
+    
+    print(f"Saved {len(items)} items to {output_file}")
+
+def run_actor(session, actor_input):
+    """
+    Starts the actor, polls until it finishes, and returns the dataset items.
+    """
     # Start Run
     url = f"https://api.apify.com/v2/acts/{ACTOR_ID}/runs?token={APIFY_API_KEY}"
-    response = requests.post(url, json=actor_input)
+    response = session.post(url, json=actor_input, timeout=REQUEST_TIMEOUT)
     
     if not response.ok:
         print(f"Error response: {response.status_code}")
@@ -56,7 +86,7 @@ def scrape_leads(job_titles, contact_location, keywords, not_keywords, industrie
     # Poll for completion
     while True:
         status_url = f"https://api.apify.com/v2/acts/{ACTOR_ID}/runs/{run_id}?token={APIFY_API_KEY}"
-        status_response = requests.get(status_url)
+        status_response = session.get(status_url, timeout=REQUEST_TIMEOUT)
         status_response.raise_for_status()
         status_data = status_response.json()["data"]
         status = status_data["status"]
@@ -68,21 +98,14 @@ def scrape_leads(job_titles, contact_location, keywords, not_keywords, industrie
         elif status in ["FAILED", "ABORTED", "TIMED-OUT"]:
             raise RuntimeError(f"Run failed with status: {status}")
         
-        time.sleep(5)
+        time.sleep(POLL_INTERVAL_SECONDS)
 
     # Fetch Results
     print("Run succeeded. Fetching results...")
     dataset_url = f"https://api.apify.com/v2/datasets/{default_dataset_id}/items?token={APIFY_API_KEY}"
-    dataset_response = requests.get(dataset_url)
+    dataset_response = session.get(dataset_url, timeout=REQUEST_TIMEOUT)
     dataset_response.raise_for_status()
-    items = dataset_response.json()
-
-    # Save to file
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
-    with open(output_file, "w") as f:
-        json.dump(items, f, indent=2)
-    
-    print(f"Saved {len(items)} items to {output_file}")
+    return dataset_response.json()
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Scrape leads using Apify code_crafter/leads-finder")
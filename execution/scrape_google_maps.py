@@ -9,14 +9,82 @@ import time
 import json
 import argparse
 import requests
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
+# Try to import orjson for fast JSON serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Load environment variables
 load_dotenv()
 
 APIFY_API_KEY = os.getenv("APIFY_API_KEY")
 ACTOR_ID = "compass~crawler-google-places"  # Note: Use tilde (~) for API calls, not slash (/)
 
+# Status polls use Apify's waitForFinish long-poll: the server holds the request until the run
+# finishes or this many seconds pass, so an unfinished run is re-polled right away. Only failed
+# status checks wait, backing off from 2s up to MAX_POLL_INTERVAL
+WAIT_FOR_FINISH_SECONDS = 60
+MAX_POLL_INTERVAL = 30
+
+# The dataset is downloaded in pages of this many items, several pages in flight at once
+DATASET_PAGE_SIZE = 1000
+DATASET_FETCH_WORKERS = 8
+
+def fetch_dataset_page(session, dataset_url, offset):
+    """
+    Fetch one page of dataset items.
+
+    Returns:
+        (items, total) where total is the dataset size reported by Apify, or None
+        if the response has no X-Apify-Pagination-Total header
+    """
+    response = session.get(dataset_url, params={"offset": offset, "limit": DATASET_PAGE_SIZE}, timeout=(10, 120))
+    response.raise_for_status()
+    items = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
+    total = response.headers.get("X-Apify-Pagination-Total")
+    return items, int(total) if total is not None else None
+
+def iter_dataset_items(session, dataset_url):
+    """
+    Yield every dataset item in order, downloading pages in parallel.
+
+    The first page also tells us the dataset size; the remaining pages are fetched
+    with offset/limit by a thread pool. At most two pages per worker are held in
+    memory while waiting for earlier pages to be written out. Without a reported
+    size, pages are fetched one after another until a short or empty page.
+    """
+    items, total = fetch_dataset_page(session, dataset_url, 0)
+    yield from items
+
+    if total is None:
+        offset = len(items)
+        while len(items) == DATASET_PAGE_SIZE:
+            items, _ = fetch_dataset_page(session, dataset_url, offset)
+            offset += len(items)
+            yield from items
+        return
+
+    offsets = range(DATASET_PAGE_SIZE, total, DATASET_PAGE_SIZE)
+    if not offsets:
+        return
+
+    print(f"  Downloading {total} items in {len(offsets) + 1} pages...")
+    with ThreadPoolExecutor(max_workers=DATASET_FETCH_WORKERS) as executor:
+        pending = deque()
+        for offset in offsets:
+            pending.append(executor.submit(fetch_dataset_page, session, dataset_url, offset))
+            if len(pending) >= DATASET_FETCH_WORKERS * 2:
+                yield from pending.popleft().result()[0]
+        while pending:
+            yield from pending.popleft().result()[0]
+
 def scrape_google_maps(search_terms, max_results, language="en", scrape_reviews=False, scrape_images=False, output_file=".tmp/google_maps_leads.json"):
     """
     Scrape Google Maps leads using the compass/crawler-google-places Apify actor.
@@ -28,6 +96,9 @@ def scrape_google_maps(search_terms, max_results, language="en", scrape_reviews=
         scrape_reviews: Whether to scrape reviews (WARNING: expensive and slow)
         scrape_images: Whether to scrape images
         output_file: Path to save the JSON results
+
+    Returns:
+        Number of businesses saved
     """
     if not APIFY_API_KEY:
         raise ValueError("APIFY_API_KEY not found in .env file")
@@ -66,92 +137,136 @@ def scrape_google_maps(search_terms, max_results, language="en", scrape_reviews=
     # Start the actor run
     # Note: API uses ~ instead of / in actor ID
     actor_id_for_api = ACTOR_ID.replace("/", "~")
-    url = f"https://api.apify.com/v2/acts/{actor_id_for_api}/runs?token={APIFY_API_KEY}"
+    url = f"https://api.apify.com/v2/acts/{actor_id_for_api}/runs"
 
-    print("Starting Apify actor run...")
-    response = requests.post(url, json=actor_input)
+    # One session for the run so the start, status polls and dataset pages all reuse pooled
+    # TLS connections. The token travels in a header so the URLs stay free of credentials
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=DATASET_FETCH_WORKERS))
+    session.headers.update({"Authorization": f"Bearer {APIFY_API_KEY}"})
 
-    if not response.ok:
-        print(f"❌ Error response: {response.status_code}")
-        print(f"Response body: {response.text}")
-        response.raise_for_status()
-
-    run_data = response.json()["data"]
-    run_id = run_data["id"]
-    default_dataset_id = run_data["defaultDatasetId"]
-
-    print(f"✓ Run started successfully")
-    print(f"  Run ID: {run_id}")
-    print(f"  Dataset ID: {default_dataset_id}")
-    print(f"  Monitor at: https://console.apify.com/actors/{ACTOR_ID}/runs/{run_id}")
-    print()
-
-    # Poll for completion
-    print("Waiting for run to complete...")
-    start_time = time.time()
-    poll_count = 0
-
-    while True:
-        status_url = f"https://api.apify.com/v2/acts/{actor_id_for_api}/runs/{run_id}?token={APIFY_API_KEY}"
-        status_response = requests.get(status_url)
-        status_response.raise_for_status()
-        status_data = status_response.json()["data"]
-        status = status_data["status"]
-
-        poll_count += 1
-        elapsed = int(time.time() - start_time)
+    try:
+        print("Starting Apify actor run...")
+        response = session.post(url, json=actor_input)
+
+        if not response.ok:
+            print(f"❌ Error response: {response.status_code}")
+            print(f"Response body: {response.text}")
+            response.raise_for_status()
+
+        run_data = response.json()["data"]
+        run_id = run_data["id"]
+        default_dataset_id = run_data["defaultDatasetId"]
+
+        print(f"✓ Run started successfully")
+        print(f"  Run ID: {run_id}")
+        print(f"  Dataset ID: {default_dataset_id}")
+        print(f"  Monitor at: https://console.apify.com/actors/{ACTOR_ID}/runs/{run_id}")
+        print()
 
-        # Show status every 5 polls (25 seconds)
-        if poll_count % 5 == 0:
+        # Poll for completion
+        print("Waiting for run to complete...")
+        start_time = time.time()
+        poll_interval = 2
+
+        while True:
+            status_url = f"https://api.apify.com/v2/acts/{actor_id_for_api}/runs/{run_id}?waitForFinish={WAIT_FOR_FINISH_SECONDS}"
+            try:
+                status_response = session.get(status_url, timeout=WAIT_FOR_FINISH_SECONDS + 30)
+                error = f"HTTP {status_response.status_code}" if status_response.status_code >= 500 else None
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                error = str(e)
+
+            if error:
+                # Network hiccups and server errors back off; client errors (bad token) raise below
+                print(f"  ⚠️  Status check failed ({error}), retrying in {poll_interval:.0f}s")
+                time.sleep(poll_interval)
+                poll_interval = min(MAX_POLL_INTERVAL, poll_interval * 1.5)
+                continue
+            poll_interval = 2
+
+            status_response.raise_for_status()
+
+            status_data = status_response.json()["data"]
+            status = status_data["status"]
+
+            elapsed = int(time.time() - start_time)
+
+            if status == "SUCCEEDED":
+                print(f"\n✓ Run succeeded in {elapsed}s")
+                break
+            elif status in ["FAILED", "ABORTED", "TIMED-OUT"]:
+                raise RuntimeError(f"❌ Run failed with status: {status}")
+
+            # Each poll already waited up to a minute server-side, so report and re-poll immediately
             print(f"  Status: {status} (elapsed: {elapsed}s)")
 
-        if status == "SUCCEEDED":
-            print(f"\n✓ Run succeeded in {elapsed}s")
-            break
-        elif status in ["FAILED", "ABORTED", "TIMED-OUT"]:
-            raise RuntimeError(f"❌ Run failed with status: {status}")
-
-        time.sleep(5)
-
-    # Fetch results from the dataset
-    print("\nFetching results from dataset...")
-    dataset_url = f"https://api.apify.com/v2/datasets/{default_dataset_id}/items?token={APIFY_API_KEY}"
-    dataset_response = requests.get(dataset_url)
-    dataset_response.raise_for_status()
-    items = dataset_response.json()
-
-    if not items:
+        # Fetch results from the dataset
+        print("\nFetching results from dataset...")
+        dataset_url = f"https://api.apify.com/v2/datasets/{default_dataset_id}/items"
+        items = iter_dataset_items(session, dataset_url)
+
+        if ORJSON_AVAILABLE:
+            dumps = orjson.dumps
+        else:
+            dumps = lambda item: json.dumps(item).encode("utf-8")
+
+        # Write each item to disk as its page arrives (still a JSON array, one item per line)
+        # and keep running totals for the summary instead of re-scanning the list
+        count = with_phone = with_website = with_email = 0
+        total_rating = 0.0
+        sample = None
+
+        os.makedirs(os.path.dirname(output_file) if os.path.dirname(output_file) else ".tmp", exist_ok=True)
+        # Write to a side file and move it into place only once the array is complete, so a
+        # failed download never leaves truncated JSON or replaces a previous good file
+        part_file = output_file + ".part"
+        try:
+            with open(part_file, "wb") as f:
+                f.write(b"[")
+                for item in items:
+                    f.write(b"\n" if count == 0 else b",\n")
+                    f.write(dumps(item))
+
+                    count += 1
+                    with_phone += bool(item.get("phone"))
+                    with_website += bool(item.get("website"))
+                    with_email += bool(item.get("email"))
+                    total_rating += item.get("totalScore", 0) or 0
+                    if sample is None:
+                        sample = item
+                f.write(b"\n]\n" if count else b"]\n")
+        except BaseException:
+            if os.path.exists(part_file):
+                os.remove(part_file)
+            raise
+        os.replace(part_file, output_file)
+    finally:
+        session.close()
+
+    if not count:
         print("⚠️  Warning: No results returned. Your search may be too specific or have no matches.")
         print("   Try broadening your search terms or checking for typos.")
 
-    # Save to file
-    os.makedirs(os.path.dirname(output_file) if os.path.dirname(output_file) else ".tmp", exist_ok=True)
-    with open(output_file, "w") as f:
-        json.dump(items, f, indent=2)
-
-    print(f"\n✓ Saved {len(items)} business(es) to {output_file}")
+    print(f"\n✓ Saved {count} business(es) to {output_file}")
 
     # Show summary statistics
-    if items:
+    if count:
         print("\n" + "=" * 60)
         print("SCRAPE SUMMARY")
         print("=" * 60)
 
-        with_phone = sum(1 for item in items if item.get("phone"))
-        with_website = sum(1 for item in items if item.get("website"))
-        with_email = sum(1 for item in items if item.get("email"))
-        avg_rating = sum(item.get("totalScore", 0) for item in items) / len(items) if items else 0
+        avg_rating = total_rating / count
 
-        print(f"Total businesses: {len(items)}")
-        print(f"With phone number: {with_phone} ({with_phone/len(items)*100:.1f}%)")
-        print(f"With website: {with_website} ({with_website/len(items)*100:.1f}%)")
-        print(f"With email: {with_email} ({with_email/len(items)*100:.1f}%)")
+        print(f"Total businesses: {count}")
+        print(f"With phone number: {with_phone} ({with_phone/count*100:.1f}%)")
+        print(f"With website: {with_website} ({with_website/count*100:.1f}%)")
+        print(f"With email: {with_email} ({with_email/count*100:.1f}%)")
         print(f"Average rating: {avg_rating:.2f} stars")
         print()
 
         # Sample business for verification
         print("Sample business (first result):")
-        sample = items[0]
         print(f"  Name: {sample.get('title', 'N/A')}")
         print(f"  Address: {sample.get('address', 'N/A')}")
         print(f"  Phone: {sample.get('phone', 'N/A')}")
@@ -170,7 +285,7 @@ def scrape_google_maps(search_terms, max_results, language="en", scrape_reviews=
     print(f"       --folder-id \"0ADWgx-M8Z5r-Uk9PVA\"")
     print("=" * 60)
 
-    return items
+    return count
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
@@ -10,6 +10,7 @@ Validates websites in parallel using threading. Checks for:
 
 Usage:
     python validate_websites.py --source-file .tmp/leads.json --output .tmp/validated_leads.json
+    python validate_websites.py --source-file .tmp/leads.json --output .tmp/validated_leads.jsonl  # written incrementally
     python validate_websites.py --source-url "https://docs.google.com/spreadsheets/d/ID/edit" --output-sheet "Validated Leads"
 """
 
@@ -18,9 +19,17 @@ import json
 import sys
 import os
 import re
-from typing import List, Dict, Any, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import heapq
+import itertools
+import random
+import socket
+import threading
+import time
+from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from urllib.parse import urlsplit, urlunsplit
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import SSLError, Timeout, RequestException
 import urllib3
 
@@ -32,6 +41,13 @@ try:
 except ImportError:
     GOOGLE_AVAILABLE = False
 
+# Try to import orjson for fast JSON parsing/serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Disable SSL warnings for cleaner output
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -40,11 +56,179 @@ SCOPES = [
     'https://www.googleapis.com/auth/drive'
 ]
 
+# Spreadsheet ID in a Google Sheets URL (.../spreadsheets/d/<id>/edit...)
+_SHEET_ID_RE = re.compile(r'/spreadsheets/d/([a-zA-Z0-9-_]+)')
+
+# Lead fields that may hold the website, in priority order (last two: Title Case Apollo format)
+WEBSITE_KEYS = (
+    'companyWebsite', 'company_website', 'website',
+    'companyDomain', 'company_domain', 'domain',
+    'Company Website', 'Company Domain'
+)
+
 # Configuration
 DEFAULT_BATCH_SIZE = 50
-DEFAULT_MAX_WORKERS = 10
+DEFAULT_MAX_WORKERS = 32  # Threads mostly wait on the network, so this can sit well above the CPU count
 DEFAULT_TIMEOUT = 10
 
+# Hosts whose DNS pre-check result is kept for the run; leads often share hosts and retries repeat them
+DNS_CACHE_SIZE = 4096
+
+# Rate limits and server errors worth another attempt. The retry is scheduled like any other
+# (timer heap in the batch), so the adapter itself never retries or sleeps
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Wait before retry N is N * RETRY_DELAY_SECONDS plus up to RETRY_JITTER_SECONDS, so rate-limited
+# hosts aren't hit by every retry at the same instant
+RETRY_DELAY_SECONDS = 2
+RETRY_JITTER_SECONDS = 1.0
+
+# Results that hold for a whole (scheme, host) - DNS failure, TLS error, refused or timed-out
+# connection - are reused for this long, so other leads on a dead site skip the check.
+# Anything decided by an HTTP response depends on the path and is never shared
+HOST_CACHE_TTL_SECONDS = 3600
+
+# Body bytes inspected for a CDN fingerprint when the headers don't show one
+SNIFF_BYTES = 4096
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Per-host connection pools kept open at once (one pool per host, shared by all workers)
+HOST_POOLS = 256
+
+# One session per worker thread (requests.Session is not thread-safe to share), all mounted on
+# one adapter: urllib3's pool manager is thread-safe, so an open connection to a host can be
+# reused by whichever worker hits that host next instead of each thread handshaking on its own
+_thread_local = threading.local()
+_sessions = []
+_sessions_lock = threading.Lock()
+_shared_adapter = None
+
+
+def _get_adapter(pool_maxsize: int) -> HTTPAdapter:
+    """Return the adapter shared by all worker sessions, creating it on first use"""
+    global _shared_adapter
+    with _sessions_lock:
+        if _shared_adapter is None:
+            _shared_adapter = HTTPAdapter(pool_connections=HOST_POOLS, pool_maxsize=pool_maxsize)
+        return _shared_adapter
+
+
+def _get_session(pool_maxsize: int = DEFAULT_MAX_WORKERS) -> requests.Session:
+    """Return this thread's session, creating it on first use"""
+    session = getattr(_thread_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        adapter = _get_adapter(pool_maxsize)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update({'User-Agent': USER_AGENT})
+        _thread_local.session = session
+        with _sessions_lock:
+            _sessions.append(session)
+    return session
+
+
+# getaddrinfo errors meaning the name has no address (as opposed to a temporary resolver failure)
+_DNS_NOT_FOUND_ERRORS = {
+    code for code in (getattr(socket, 'EAI_NONAME', None), getattr(socket, 'EAI_NODATA', None)) if code is not None
+}
+
+# A "no such host" answer is only trusted while this host resolves; without DNS every name fails.
+# The probe result is reused for DNS_PROBE_TTL_SECONDS
+DNS_PROBE_HOST = 'www.google.com'
+DNS_PROBE_TTL_SECONDS = 60
+
+_resolved_hosts = set()
+_dns_lock = threading.Lock()
+_dns_probe = {'ok': False, 'checked_at': float('-inf')}
+
+
+def _resolver_works() -> bool:
+    """Return whether DNS currently resolves a known-good host (re-probed at most once a minute)"""
+    with _dns_lock:
+        if time.monotonic() - _dns_probe['checked_at'] < DNS_PROBE_TTL_SECONDS:
+            return _dns_probe['ok']
+        try:
+            socket.getaddrinfo(DNS_PROBE_HOST, 443, type=socket.SOCK_STREAM)
+            ok = True
+        except (socket.gaierror, UnicodeError, ValueError):
+            ok = False
+        _dns_probe.update(ok=ok, checked_at=time.monotonic())
+        return ok
+
+
+def host_resolves(host: str) -> bool:
+    """
+    Cheap pre-check before any HTTP request: False only if DNS says the host does not exist.
+    Resolver hiccups, or a resolver that can't find a known-good host either, count as
+    resolvable so the HTTP attempt (and its retries) still decide. Only hosts that resolved
+    are cached; a negative answer is looked up again next time.
+    """
+    if host in _resolved_hosts:
+        return True
+    try:
+        socket.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+    except socket.gaierror as e:
+        return e.errno not in _DNS_NOT_FOUND_ERRORS or not _resolver_works()
+    except (UnicodeError, ValueError):
+        return False
+    with _dns_lock:
+        if len(_resolved_hosts) < DNS_CACHE_SIZE:
+            _resolved_hosts.add(host)
+    return True
+
+
+# (scheme, netloc) -> (status, status_message, expires_at)
+_host_cache: Dict[Tuple[str, str], Tuple[str, str, float]] = {}
+_host_lock = threading.Lock()
+
+
+def _host_cache_get(key: Tuple[str, str]) -> Optional[Tuple[str, str]]:
+    """Return the unexpired cached result for a host, if any"""
+    with _host_lock:
+        entry = _host_cache.get(key)
+    if entry is None or entry[2] < time.monotonic():
+        return None
+    return entry[0], entry[1]
+
+
+def _host_cache_put(key: Tuple[str, str], result: Tuple[str, str]):
+    """Remember a host's final result for HOST_CACHE_TTL_SECONDS"""
+    with _host_lock:
+        _host_cache[key] = (result[0], result[1], time.monotonic() + HOST_CACHE_TTL_SECONDS)
+
+
+def _remember_host_error(error: Exception, host_key: Tuple[str, str], result: Tuple[str, str]) -> Tuple[str, str]:
+    """
+    Cache a final result if the error is a connection-level failure on the lead's own host
+    (not on a redirect target), then return the result unchanged
+    """
+    request = getattr(error, 'request', None)
+    if isinstance(error, requests.exceptions.ConnectionError) and request is not None:
+        parts = urlsplit(request.url)
+        if (parts.scheme.lower(), parts.netloc.lower()) == host_key:
+            _host_cache_put(host_key, result)
+    return result
+
+
+def _clear_host_cache():
+    """Forget all cached host results"""
+    with _host_lock:
+        _host_cache.clear()
+
+
+def _close_sessions():
+    """Close every session created by worker threads and the shared connection pools"""
+    global _shared_adapter
+    with _sessions_lock:
+        for session in _sessions:
+            session.close()
+        _sessions.clear()
+        if _shared_adapter is not None:
+            _shared_adapter.close()
+            _shared_adapter = None
+
 
 def authenticate_google():
     """Authenticate with Google Sheets API using credentials.json (Service Account)"""
@@ -60,6 +244,12 @@ def authenticate_google():
         sys.exit(3)
 
 
+def _extract_sheet_id(url: str) -> Optional[str]:
+    """Return the spreadsheet ID from a Google Sheets URL, or None if it has none"""
+    match = _SHEET_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
 def load_from_google_sheets(spreadsheet_url: str, sheet_name: str = None) -> List[Dict[str, Any]]:
     """Load leads from Google Sheets"""
     if not GOOGLE_AVAILABLE:
@@ -67,22 +257,22 @@ def load_from_google_sheets(spreadsheet_url: str, sheet_name: str = None) -> Lis
         sys.exit(3)
     
     # Extract spreadsheet ID from URL
-    match = re.search(r'/spreadsheets/d/([a-zA-Z0-9-_]+)', spreadsheet_url)
-    if not match:
+    spreadsheet_id = _extract_sheet_id(spreadsheet_url)
+    if not spreadsheet_id:
         print(f"ERROR: Invalid Google Sheets URL: {spreadsheet_url}")
         sys.exit(3)
     
-    spreadsheet_id = match.group(1)
-    
     # Authenticate
     creds = authenticate_google()
     service = build('sheets', 'v4', credentials=creds)
     
     # Get sheet data
     range_name = sheet_name if sheet_name else 'A:ZZ'
+    # Formatted values keep cells as displayed (leading zeros, phone formatting, currency)
     result = service.spreadsheets().values().get(
         spreadsheetId=spreadsheet_id,
-        range=range_name
+        range=range_name,
+        valueRenderOption='FORMATTED_VALUE'
     ).execute()
     
     rows = result.get('values', [])
@@ -92,11 +282,14 @@ def load_from_google_sheets(spreadsheet_url: str, sheet_name: str = None) -> Lis
     
     # Convert to list of dictionaries (first row as headers)
     headers = rows[0]
+    num_headers = len(headers)
     leads = []
     for row in rows[1:]:
-        # Pad row with empty strings if it's shorter than headers
-        row = row + [''] * (len(headers) - len(row))
-        lead = dict(zip(headers, row))
+        if len(row) < num_headers:
+            # Pad row with empty strings if it's shorter than headers (without copying it)
+            lead = dict(zip(headers, itertools.chain(row, itertools.repeat('', num_headers - len(row)))))
+        else:
+            lead = dict(zip(headers, row))
         leads.append(lead)
     
     return leads
@@ -109,8 +302,13 @@ def load_from_json(file_path: str) -> List[Dict[str, Any]]:
         sys.exit(3)
     
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        if ORJSON_AVAILABLE:
+            # Parse the raw bytes directly, skipping the decode to str
+            with open(file_path, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(file_path, 'r') as f:
+                data = json.load(f)
         
         # Handle both list and dict formats
         if isinstance(data, list):
@@ -126,133 +324,228 @@ def load_from_json(file_path: str) -> List[Dict[str, Any]]:
 
 
 def get_website_url(lead: Dict[str, Any]) -> str:
-    """Extract website URL from lead"""
-    website = (
-        lead.get('companyWebsite') or 
-        lead.get('company_website') or 
-        lead.get('website') or
-        lead.get('companyDomain') or
-        lead.get('company_domain') or
-        lead.get('domain') or
-        # Title Case Apollo format
-        lead.get('Company Website') or
-        lead.get('Company Domain') or
-        ''
-    )
-    
-    website = str(website).strip()
+    """Extract website URL from lead (always https://)"""
+    website = ''
+    for key in WEBSITE_KEYS:
+        value = lead.get(key)
+        if value:
+            website = str(value).strip()
+            break
+    
+    if not website:
+        return ''
     
     # Convert HTTP to HTTPS
     if website.startswith('http://'):
-        website = website.replace('http://', 'https://', 1)
+        return 'https://' + website[7:]
     
     # Add https:// if missing
-    if website and not website.startswith('http'):
-        website = 'https://' + website
-    
-    return website
+    if website.startswith('https://'):
+        return website
+    return 'https://' + website
+
 
+def normalize_url(url: str) -> str:
+    """Key for deduplicating URLs: lowercase scheme/host, no trailing slash or fragment"""
+    if not url:
+        return ''
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), parts.query, ''))
 
-def validate_website(url: str, timeout: int = DEFAULT_TIMEOUT, retry_count: int = 0, max_retries: int = 3) -> Tuple[str, str]:
+
+def detect_cdn(session: requests.Session, url: str, response: requests.Response, timeout: float) -> str:
+    """
+    Return "Cloudflare" or "CloudFront" if the response came from that CDN, else "".
+    Headers decide almost every case; otherwise at most SNIFF_BYTES of the body are read.
     """
-    Validate a single website URL with retry logic
+    headers = response.headers  # case-insensitive
+    server = headers.get('Server', '').lower()
+    via = headers.get('Via', '').lower()
+    
+    if 'cf-ray' in headers or 'cloudflare' in server or 'cloudflare' in via:
+        return 'Cloudflare'
+    if 'x-amz-cf-id' in headers or 'cloudfront' in server or 'cloudfront' in via:
+        return 'CloudFront'
+    
+    # Headers inconclusive: sniff the start of the body (HEAD has none, so fetch it streamed)
+    body_response = response
+    if response.request.method != 'GET':
+        try:
+            body_response = session.get(url, timeout=timeout, allow_redirects=True, verify=True, stream=True)
+        except RequestException:
+            return ''
+    try:
+        body = next(body_response.iter_content(SNIFF_BYTES), b'').lower()
+    except RequestException:
+        body = b''
+    finally:
+        body_response.close()
+    
+    if b'cloudflare' in body:
+        return 'Cloudflare'
+    if b'cloudfront' in body:
+        return 'CloudFront'
+    return ''
+
+
+def retry_delay(attempt: int) -> float:
+    """Seconds to wait before the given retry attempt (linear backoff with jitter: ~2s, 4s, 6s)"""
+    return attempt * RETRY_DELAY_SECONDS + random.random() * RETRY_JITTER_SECONDS
+
+
+def check_website(url: str, attempt: int = 0, timeout: int = DEFAULT_TIMEOUT, max_retries: int = 3,
+                  pool_maxsize: int = DEFAULT_MAX_WORKERS) -> Optional[Tuple[str, str]]:
+    """
+    Make one validation attempt for a website URL (no sleeping)
     
     Returns:
-        (status, status_message)
+        (status, status_message), or None if the attempt failed and should be retried
     """
     if not url:
         return ('no_url', 'No website URL found')
     
-    # Add delay for retries (exponential backoff)
-    if retry_count > 0:
-        import time
-        delay = retry_count * 2  # 2s, 4s, 6s
-        time.sleep(delay)
+    try:
+        parts = urlsplit(url)
+        host = parts.hostname
+    except ValueError:
+        host = None
+    if not host:
+        return ('invalid', 'DNS: host not resolvable')
+    
+    host_key = (parts.scheme.lower(), parts.netloc.lower())
+    if attempt == 0:
+        cached = _host_cache_get(host_key)
+        if cached is not None:
+            return cached
+        
+        # Skip the TLS handshake/timeout cycle entirely for domains that no longer exist
+        if not host_resolves(host):
+            result = ('invalid', 'DNS: host not resolvable')
+            _host_cache_put(host_key, result)
+            return result
+    
+    return _request_website(url, host_key, attempt, timeout, max_retries, pool_maxsize)
+
+
+def _request_website(url: str, host_key: Tuple[str, str], attempt: int, timeout: int, max_retries: int,
+                     pool_maxsize: int) -> Optional[Tuple[str, str]]:
+    """
+    Issue the HEAD (or GET) request for one attempt and classify the response.
+    Final connection-level failures are cached for the host under host_key.
+    
+    Returns:
+        (status, status_message), or None if the attempt should be retried
+    """
+    # Retries and the HEAD -> GET fallback reuse pooled connections to the host
+    session = _get_session(pool_maxsize)
     
     # Increase timeout for retries
-    actual_timeout = timeout * (1 + retry_count * 0.5)  # 10s, 15s, 20s
+    actual_timeout = timeout * (1 + attempt * 0.5)  # 10s, 15s, 20s
+    can_retry = attempt < max_retries
     
     try:
         # Try HEAD request first (faster)
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+        response = session.head(url, timeout=actual_timeout, allow_redirects=True, verify=True)
         
-        response = requests.head(url, timeout=actual_timeout, allow_redirects=True, headers=headers, verify=True)
-        
-        # If HEAD not allowed, try GET
+        # If HEAD not allowed, try GET (streamed: the body is only read if we need to sniff it)
         if response.status_code == 405:
-            response = requests.get(url, timeout=actual_timeout, allow_redirects=True, headers=headers, verify=True)
-        
-        # Check status code
-        if 200 <= response.status_code < 300:
-            retry_msg = f" (retry {retry_count})" if retry_count > 0 else ""
-            return ('valid', f'{response.status_code} OK{retry_msg}')
+            response = session.get(url, timeout=actual_timeout, allow_redirects=True, verify=True, stream=True)
         
-        # Check for Cloudflare/CloudFront
-        response_text = response.text.lower() if hasattr(response, 'text') else ''
-        server_header = response.headers.get('Server', '').lower()
-        
-        is_cloudflare = 'cloudflare' in response_text or 'cloudflare' in server_header or 'cf-ray' in response.headers
-        is_cloudfront = 'cloudfront' in response_text or 'cloudfront' in server_header
-        
-        if is_cloudflare or is_cloudfront:
+        try:
+            # Check status code
+            if 200 <= response.status_code < 300:
+                retry_msg = f" (retry {attempt})" if attempt > 0 else ""
+                return ('valid', f'{response.status_code} OK{retry_msg}')
+            
+            # Check for Cloudflare/CloudFront
             if response.status_code in [403, 429]:
-                # Retry blocked requests
-                if retry_count < max_retries:
-                    return validate_website(url, timeout, retry_count + 1, max_retries)
-                
-                service = "Cloudflare" if is_cloudflare else "CloudFront"
-                if response.status_code == 403:
-                    return ('blocked', f'{response.status_code} Forbidden - {service} block detected (retried {retry_count}x)')
-                else:
-                    return ('blocked', f'{response.status_code} Too Many Requests - {service} rate limit (retried {retry_count}x)')
-        
-        # Other non-2xx codes
-        return ('invalid', f'{response.status_code} {response.reason}')
+                service = detect_cdn(session, url, response, actual_timeout)
+                if service:
+                    # Retry blocked requests
+                    if can_retry:
+                        return None
+                    
+                    if response.status_code == 403:
+                        return ('blocked', f'{response.status_code} Forbidden - {service} block detected (retried {attempt}x)')
+                    else:
+                        return ('blocked', f'{response.status_code} Too Many Requests - {service} rate limit (retried {attempt}x)')
+            
+            # Retry rate limits and server errors
+            if response.status_code in RETRY_STATUSES and can_retry:
+                return None
+            
+            # Other non-2xx codes
+            return ('invalid', f'{response.status_code} {response.reason}')
+        finally:
+            response.close()
         
     except SSLError as e:
         error_msg = str(e)
         if 'certificate verify failed' in error_msg.lower():
-            return ('ssl_error', 'SSL Certificate verification failed')
-        return ('ssl_error', f'SSL Error: {error_msg[:100]}')
+            return _remember_host_error(e, host_key, ('ssl_error', 'SSL Certificate verification failed'))
+        return _remember_host_error(e, host_key, ('ssl_error', f'SSL Error: {error_msg[:100]}'))
     
-    except Timeout:
+    except Timeout as e:
         # Retry timeouts
-        if retry_count < max_retries:
-            return validate_website(url, timeout, retry_count + 1, max_retries)
-        return ('timeout', f'Request timeout ({actual_timeout:.0f}s, retried {retry_count}x)')
+        if can_retry:
+            return None
+        return _remember_host_error(e, host_key, ('timeout', f'Request timeout ({actual_timeout:.0f}s, retried {attempt}x)'))
     
     except RequestException as e:
+        # Retry connection errors (including Cloudflare/CloudFront ones)
+        if can_retry:
+            return None
+        
         error_msg = str(e)
         
         # Check if error message mentions Cloudflare/CloudFront
         if 'cloudflare' in error_msg.lower():
-            if retry_count < max_retries:
-                return validate_website(url, timeout, retry_count + 1, max_retries)
-            return ('blocked', f'Cloudflare block: {error_msg[:80]} (retried {retry_count}x)')
+            return ('blocked', f'Cloudflare block: {error_msg[:80]} (retried {attempt}x)')
         
         if 'cloudfront' in error_msg.lower():
-            if retry_count < max_retries:
-                return validate_website(url, timeout, retry_count + 1, max_retries)
-            return ('blocked', f'CloudFront block: {error_msg[:80]} (retried {retry_count}x)')
+            return ('blocked', f'CloudFront block: {error_msg[:80]} (retried {attempt}x)')
         
-        # Retry unknown connection errors
-        if retry_count < max_retries:
-            return validate_website(url, timeout, retry_count + 1, max_retries)
-        
-        return ('unknown', f'Error: {error_msg[:80]} (retried {retry_count}x)')
+        return _remember_host_error(e, host_key, ('unknown', f'Error: {error_msg[:80]} (retried {attempt}x)'))
     
     except Exception as e:
         # Retry unknown errors
-        if retry_count < max_retries:
-            return validate_website(url, timeout, retry_count + 1, max_retries)
+        if can_retry:
+            return None
         
-        return ('unknown', f'Unknown error: {str(e)[:80]} (retried {retry_count}x)')
+        return ('unknown', f'Unknown error: {str(e)[:80]} (retried {attempt}x)')
+
+
+def validate_website(url: str, timeout: int = DEFAULT_TIMEOUT, max_retries: int = 3,
+                     pool_maxsize: int = DEFAULT_MAX_WORKERS) -> Tuple[str, str]:
+    """
+    Validate a single website URL with retry logic, sleeping between attempts
+    
+    Returns:
+        (status, status_message)
+    """
+    for attempt in range(max_retries + 1):
+        if attempt > 0:
+            time.sleep(retry_delay(attempt))
+        result = check_website(url, attempt, timeout, max_retries, pool_maxsize)
+        if result is not None:
+            return result
+
+
+def write_jsonl_line(f, lead: Dict[str, Any]):
+    """Append one lead as a JSON line to a file opened in binary mode"""
+    if ORJSON_AVAILABLE:
+        f.write(orjson.dumps(lead))
+    else:
+        f.write(json.dumps(lead).encode('utf-8'))
+    f.write(b'\n')
 
 
 def validate_websites_batch(leads: List[Dict[str, Any]], max_workers: int = DEFAULT_MAX_WORKERS, 
-                            timeout: int = DEFAULT_TIMEOUT, verbose: bool = False) -> List[Dict[str, Any]]:
+                            timeout: int = DEFAULT_TIMEOUT, verbose: bool = False,
+                            jsonl_path: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     Validate websites in parallel using threading
     
@@ -261,51 +554,109 @@ def validate_websites_batch(leads: List[Dict[str, Any]], max_workers: int = DEFA
         max_workers: Number of concurrent threads
         timeout: Timeout per request in seconds
         verbose: Print progress
+        jsonl_path: If given, each lead is appended to this JSONL file as soon as its
+            status is known (completion order), so partial results survive a crash
     
     Returns:
         List of leads with website_status and website_status_message fields added
     """
     total = len(leads)
-    validated_leads = []
     
-    # Create URL mapping
-    url_lead_pairs = [(i, get_website_url(lead), lead) for i, lead in enumerate(leads)]
+    # Leads often share a website; validate each distinct URL once and map the result back.
+    # Results live in flat lists indexed by position (unique URL -> slot, lead -> slot)
+    unique_urls = []
+    slot_by_key = {}
+    lead_slots = []
+    for lead in leads:
+        url = get_website_url(lead)
+        key = normalize_url(url)
+        if not key:
+            lead_slots.append(-1)
+            continue
+        slot = slot_by_key.get(key)
+        if slot is None:
+            slot = slot_by_key[key] = len(unique_urls)
+            unique_urls.append(url)
+        lead_slots.append(slot)
+    
+    unique_total = len(unique_urls)
+    statuses = [None] * unique_total
+    no_url = ('no_url', 'No website URL found')
+    
+    out = open(jsonl_path, 'wb') if jsonl_path else None
+    try:
+        if out is not None:
+            # Leads sharing a slot are written together when that URL finishes
+            slot_leads = [[] for _ in range(unique_total)]
+            for lead, slot in zip(leads, lead_slots):
+                if slot >= 0:
+                    slot_leads[slot].append(lead)
+                else:
+                    lead['website_status'], lead['website_status_message'] = no_url
+                    write_jsonl_line(out, lead)
     
-    print(f"\nValidating {total} websites with {max_workers} workers...")
+        print(f"\nValidating {total} websites ({unique_total} unique) with {max_workers} workers...")
     
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
-        future_to_data = {
-            executor.submit(validate_website, url, timeout): (idx, url, lead)
-            for idx, url, lead in url_lead_pairs
-        }
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            def submit(slot, attempt):
+                return executor.submit(check_website, unique_urls[slot], attempt, timeout, pool_maxsize=max_workers)
         
-        completed = 0
-        for future in as_completed(future_to_data):
-            idx, url, lead = future_to_data[future]
-            
-            try:
-                status, status_message = future.result()
-            except Exception as e:
-                status = 'unknown'
-                status_message = f'Validation error: {str(e)[:100]}'
-            
-            # Add status fields to lead
-            lead['website_status'] = status
-            lead['website_status_message'] = status_message
+            # Each future is one attempt. A failed attempt goes on a timer heap of (due, slot, attempt)
+            # and is resubmitted once its backoff has passed, so no worker thread sleeps through a delay
+            future_to_attempt = {submit(slot, 0): (slot, 0) for slot in range(unique_total)}
+            retry_heap = []
+        
+            completed = 0
+            while future_to_attempt or retry_heap:
+                now = time.monotonic()
+                while retry_heap and retry_heap[0][0] <= now:
+                    _, slot, attempt = heapq.heappop(retry_heap)
+                    future_to_attempt[submit(slot, attempt)] = (slot, attempt)
             
-            completed += 1
+                next_due = max(0.0, retry_heap[0][0] - now) if retry_heap else None
+                if not future_to_attempt:
+                    time.sleep(next_due)
+                    continue
             
-            if verbose:
-                company = lead.get('company_name') or lead.get('companyName') or 'Unknown'
-                print(f"[{completed}/{total}] {company}: {status} - {status_message}")
-            elif completed % 50 == 0:
-                print(f"Progress: {completed}/{total} ({completed/total*100:.1f}%)")
-        
-        # Return leads in original order
-        validated_leads = [lead for _, _, lead in sorted(url_lead_pairs, key=lambda x: x[0])]
+                done, _ = wait(future_to_attempt, timeout=next_due, return_when=FIRST_COMPLETED)
+                for future in done:
+                    slot, attempt = future_to_attempt.pop(future)
+                
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = ('unknown', f'Validation error: {str(e)[:100]}')
+                
+                    if result is None:
+                        heapq.heappush(retry_heap, (time.monotonic() + retry_delay(attempt + 1), slot, attempt + 1))
+                        continue
+                
+                    statuses[slot] = result
+                    status, status_message = result
+                    completed += 1
+                
+                    if out is not None:
+                        for lead in slot_leads[slot]:
+                            lead['website_status'], lead['website_status_message'] = result
+                            write_jsonl_line(out, lead)
+                        out.flush()
+                
+                    if verbose:
+                        print(f"[{completed}/{unique_total}] {unique_urls[slot]}: {status} - {status_message}")
+                    elif completed % 50 == 0:
+                        print(f"Progress: {completed}/{unique_total} ({completed/unique_total*100:.1f}%)")
+    finally:
+        # Also on errors/Ctrl-C: release pooled connections and flush what was written so far
+        _close_sessions()
+        _clear_host_cache()
+        if out is not None:
+            out.close()
+    
+    # Add status fields to leads in one sequential pass (leads keep their original order)
+    for lead, slot in zip(leads, lead_slots):
+        lead['website_status'], lead['website_status_message'] = statuses[slot] if slot >= 0 else no_url
     
-    return validated_leads
+    return leads
 
 
 def print_validation_stats(leads: List[Dict[str, Any]]):
@@ -339,7 +690,7 @@ def main():
     
     # Output options
     output_group = parser.add_mutually_exclusive_group(required=True)
-    output_group.add_argument('--output', '-o', help='Output JSON file path')
+    output_group.add_argument('--output', '-o', help='Output JSON file path (.jsonl is written line by line as results arrive)')
     output_group.add_argument('--output-sheet', help='Name of Google Sheet to create')
     
     parser.add_argument('--sheet-name', help='Sheet name (for Google Sheets source)', default=None)
@@ -364,16 +715,24 @@ def main():
         print("WARNING: No leads to process")
         sys.exit(0)
     
-    # Validate websites
-    validated_leads = validate_websites_batch(leads, args.max_workers, args.timeout, args.verbose)
+    # Validate websites (.jsonl output is written as results come in)
+    jsonl_path = args.output if args.output and args.output.endswith('.jsonl') else None
+    validated_leads = validate_websites_batch(leads, args.max_workers, args.timeout, args.verbose, jsonl_path)
     
     # Print statistics
     print_validation_stats(validated_leads)
     
     # Save results
-    if args.output:
-        with open(args.output, 'w') as f:
-            json.dump(validated_leads, f, indent=2)
+    if jsonl_path:
+        print(f"Validated leads saved to: {args.output}")
+    
+    elif args.output:
+        if ORJSON_AVAILABLE:
+            with open(args.output, 'wb') as f:
+                f.write(orjson.dumps(validated_leads, option=orjson.OPT_INDENT_2))
+        else:
+            with open(args.output, 'w') as f:
+                json.dump(validated_leads, f, indent=2)
         print(f"Validated leads saved to: {args.output}")
     
     elif args.output_sheet:
@@ -382,10 +741,10 @@ def main():
         # If source was a spreadsheet, export to the same spreadsheet
         target_spreadsheet_id = None
         if args.source_url:
-            try:
-                target_spreadsheet_id = args.source_url.split('/d/')[1].split('/')[0]
+            target_spreadsheet_id = _extract_sheet_id(args.source_url)
+            if target_spreadsheet_id:
                 print(f"Targeting source spreadsheet: {target_spreadsheet_id}")
-            except Exception:
+            else:
                 print("Could not extract spreadsheet ID from source URL. Will create new sheet.")
         
         try: